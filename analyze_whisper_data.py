@@ -9,7 +9,6 @@
 import asyncio
 import websockets
 import json
-import subprocess
 import os
 import sys
 from datetime import datetime
@@ -22,6 +21,7 @@ SAMPLE_RATE = 16000
 CHUNK_SIZE = 4800  # 0.3초 분량 (min-chunk-size와 맞춤)
 MAX_DURATION = 30  # 30초만 분석
 START_OFFSET = 90  # 90초부터 시작 (국민의례 이후)
+PIPE_LIMIT = 1 << 20  # FFmpeg stdout 파이프 버퍼 (1MB)
 
 async def analyze_whisper_stream():
     """WhisperLiveKit에 오디오를 보내고 응답을 분석"""
@@ -56,15 +56,20 @@ async def analyze_whisper_stream():
     print(f"[INFO] FFmpeg 시작: 오디오 추출 중...")
     
     try:
-        ffmpeg_proc = subprocess.Popen(
-            ffmpeg_cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.DEVNULL
+        # [advice from AI] 비동기 서브프로세스 - 파이프 읽기가 이벤트 루프를 막지 않도록
+        ffmpeg_proc = await asyncio.create_subprocess_exec(
+            *ffmpeg_cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            limit=PIPE_LIMIT
         )
     except Exception as e:
         print(f"[ERROR] FFmpeg 실행 실패: {e}")
         return
     
+    # [advice from AI] 결과 파일은 시작 시 한 번 열고 응답마다 바로 기록
+    out_f = open(output_file, 'w', encoding='utf-8')
+    
     # WebSocket 연결
     print(f"[INFO] WhisperLiveKit 연결 중: {WHISPER_WS_URL}")
     
@@ -73,13 +78,12 @@ async def analyze_whisper_stream():
             print(f"[INFO] WebSocket 연결됨!")
             print()
             
-            responses = []
+            tracker = LinesChangeTracker()
             chunk_count = 0
             audio_time = 0.0
             
             async def receive_messages():
-                """응답 수신"""
-                nonlocal responses
+                """응답 수신 (수신 즉시 파일에 기록 + 변화 추적)"""
                 try:
                     async for message in ws:
                         data = json.loads(message)
@@ -88,7 +92,9 @@ async def analyze_whisper_stream():
                         data['_recv_time'] = datetime.now().isoformat()
                         data['_audio_time'] = audio_time
                         
-                        responses.append(data)
+                        # [advice from AI] 응답을 메모리에 쌓지 않고 바로 JSONL로 기록
+                        out_f.write(json.dumps(data, ensure_ascii=False) + '\n')
+                        tracker.update(data)
                         
                         # 실시간 출력
                         lines = data.get('lines', [])
@@ -118,7 +124,10 @@ async def analyze_whisper_stream():
             print("=" * 60)
             
             while True:
-                chunk = ffmpeg_proc.stdout.read(CHUNK_SIZE * 2)  # 16bit = 2 bytes
+                try:
+                    chunk = await ffmpeg_proc.stdout.readexactly(CHUNK_SIZE * 2)  # 16bit = 2 bytes
+                except asyncio.IncompleteReadError as e:
+                    chunk = e.partial  # 마지막 남은 조각
                 if not chunk:
                     break
                 
@@ -142,81 +151,104 @@ async def analyze_whisper_stream():
             except asyncio.CancelledError:
                 pass
             
-            # 결과 저장
             print(f"\n[INFO] 분석 결과 저장: {output_file}")
-            with open(output_file, 'w', encoding='utf-8') as f:
-                for resp in responses:
-                    f.write(json.dumps(resp, ensure_ascii=False) + '\n')
             
             # 분석 결과 출력
-            print_analysis(responses)
+            print_analysis(tracker)
             
     except Exception as e:
         print(f"[ERROR] WebSocket 오류: {e}")
         import traceback
         traceback.print_exc()
     finally:
-        ffmpeg_proc.terminate()
+        if ffmpeg_proc.returncode is None:
+            ffmpeg_proc.terminate()
+        await ffmpeg_proc.wait()
+        out_f.close()
 
 
-def print_analysis(responses):
-    """분석 결과 출력"""
-    print("\n" + "=" * 60)
-    print("📊 데이터 흐름 분석 결과")
-    print("=" * 60)
+class LinesChangeTracker:
+    """응답을 하나씩 받아 lines 변화를 증분 추적 (응답 수와 무관하게 O(1) 메모리)"""
     
-    if not responses:
-        print("[WARN] 응답 없음")
-        return
+    MAX_KEPT_CHANGES = 20  # 출력용으로 보관할 처음 N개 변화
     
-    # 통계
-    total_responses = len(responses)
-    lines_changes = []
-    prev_lines_count = 0
-    prev_lines_text = []
+    def __init__(self):
+        self.total_responses = 0
+        self.total_changes = 0
+        self.first_changes = []
+        self.last_response = None
+        self._prev_lines_count = 0
+        self._prev_lines_text = []
     
-    for resp in responses:
+    def _record(self, change):
+        self.total_changes += 1
+        if len(self.first_changes) < self.MAX_KEPT_CHANGES:
+            self.first_changes.append(change)
+    
+    def update(self, resp):
+        self.total_responses += 1
+        self.last_response = resp
+        
         lines = resp.get('lines', [])
         lines_count = len(lines)
+        audio_time = resp.get('_audio_time', 0)
+        prev_lines_text = self._prev_lines_text
         
         # lines 변화 감지
-        if lines_count != prev_lines_count:
-            lines_changes.append({
+        if lines_count != self._prev_lines_count:
+            self._record({
                 'type': 'count_change',
-                'from': prev_lines_count,
+                'from': self._prev_lines_count,
                 'to': lines_count,
-                'time': resp.get('_audio_time', 0)
+                'time': audio_time
             })
         
         # 텍스트 변화 감지
-        for i, line in enumerate(lines):
-            text = line.get('text', '').strip()
+        # [advice from AI] strip 메서드 조회를 루프 밖으로 빼고, 이전과 동일하면 줄 단위 비교 생략
+        strip = str.strip
+        texts = [strip(line.get('text', '')) for line in lines]
+        if texts == prev_lines_text:
+            self._prev_lines_count = lines_count
+            return
+        
+        for i, text in enumerate(texts):
             if i < len(prev_lines_text):
                 if text != prev_lines_text[i]:
-                    lines_changes.append({
+                    self._record({
                         'type': 'text_change',
                         'index': i,
                         'from': prev_lines_text[i][:30],
                         'to': text[:30],
-                        'time': resp.get('_audio_time', 0)
+                        'time': audio_time
                     })
             else:
-                lines_changes.append({
+                self._record({
                     'type': 'new_line',
                     'index': i,
                     'text': text[:30],
-                    'time': resp.get('_audio_time', 0)
+                    'time': audio_time
                 })
         
-        prev_lines_count = lines_count
-        prev_lines_text = [line.get('text', '').strip() for line in lines]
+        self._prev_lines_count = lines_count
+        self._prev_lines_text = texts
+
+
+def print_analysis(tracker):
+    """분석 결과 출력"""
+    print("\n" + "=" * 60)
+    print("📊 데이터 흐름 분석 결과")
+    print("=" * 60)
+    
+    if not tracker.total_responses:
+        print("[WARN] 응답 없음")
+        return
     
     print(f"\n📈 기본 통계:")
-    print(f"   - 총 응답 수: {total_responses}")
-    print(f"   - lines 변화 이벤트: {len(lines_changes)}")
+    print(f"   - 총 응답 수: {tracker.total_responses}")
+    print(f"   - lines 변화 이벤트: {tracker.total_changes}")
     
-    print(f"\n🔄 lines 변화 패턴 (처음 20개):")
-    for i, change in enumerate(lines_changes[:20]):
+    print(f"\n🔄 lines 변화 패턴 (처음 {LinesChangeTracker.MAX_KEPT_CHANGES}개):")
+    for change in tracker.first_changes:
         if change['type'] == 'count_change':
             print(f"   [{change['time']:.1f}s] 📊 lines 개수: {change['from']} → {change['to']}")
         elif change['type'] == 'text_change':
@@ -224,21 +256,19 @@ def print_analysis(responses):
         elif change['type'] == 'new_line':
             print(f"   [{change['time']:.1f}s] 🆕 lines[{change['index']}] 추가: \"{change['text']}\"")
     
-    if len(lines_changes) > 20:
-        print(f"   ... 외 {len(lines_changes) - 20}개 이벤트")
+    if tracker.total_changes > len(tracker.first_changes):
+        print(f"   ... 외 {tracker.total_changes - len(tracker.first_changes)}개 이벤트")
     
     # 마지막 응답의 전체 lines 출력
-    if responses:
-        last_resp = responses[-1]
-        last_lines = last_resp.get('lines', [])
-        print(f"\n📋 마지막 응답의 lines ({len(last_lines)}개):")
-        for i, line in enumerate(last_lines):
-            text = line.get('text', '')
-            speaker = line.get('speaker', '?')
-            start = line.get('start', '?')
-            end = line.get('end', '?')
-            print(f"   [{i}] speaker={speaker}, start={start}, end={end}")
-            print(f"       text: \"{text[:60]}{'...' if len(text) > 60 else ''}\"")
+    last_lines = tracker.last_response.get('lines', [])
+    print(f"\n📋 마지막 응답의 lines ({len(last_lines)}개):")
+    for i, line in enumerate(last_lines):
+        text = line.get('text', '')
+        speaker = line.get('speaker', '?')
+        start = line.get('start', '?')
+        end = line.get('end', '?')
+        print(f"   [{i}] speaker={speaker}, start={start}, end={end}")
+        print(f"       text: \"{text[:60]}{'...' if len(text) > 60 else ''}\"")
 
 
 if __name__ == "__main__":
@@ -3,6 +3,8 @@
 import os
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from dotenv import load_dotenv
 
@@ -29,7 +31,8 @@ app = FastAPI(
     """,
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse  # [advice from AI] orjson 직렬화 (UTF-8 그대로 출력)
 )
 
 # [advice from AI] CORS 설정 (프론트엔드 연동용)
@@ -46,16 +49,62 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# [advice from AI] 관리 API JSON 응답 GZip 압축
+# SSE/영상 프록시 등 스트리밍 응답은 압축 버퍼링으로 지연되므로 경로를 한정
+class PathGZipMiddleware(GZipMiddleware):
+    """지정한 경로 접두사에만 GZip을 적용하는 미들웨어"""
+    
+    def __init__(self, app, path_prefixes: tuple, **kwargs):
+        super().__init__(app, **kwargs)
+        self.path_prefixes = path_prefixes
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith(self.path_prefixes):
+            await super().__call__(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+
+app.add_middleware(PathGZipMiddleware, path_prefixes=("/api/v1/admin/",), minimum_size=1024)
+
 # [advice from AI] 라우터 등록
 app.include_router(transcribe.router)
 app.include_router(pipeline.router)
 app.include_router(realtime.router)
 app.include_router(admin.router, prefix="/api/v1")  # [advice from AI] 사전/필터 관리 API
 
-# [advice from AI] 정적 파일 서빙 (admin.html)
+# [advice from AI] 정적 파일 서빙 (admin.html) - 브라우저 캐시 헤더 추가
+STATIC_MAX_AGE = 3600  # 파일명 해시가 없으므로 immutable 대신 1시간
+
+
+class CachedStaticFiles(StaticFiles):
+    """Cache-Control 헤더를 붙여 반복 로드 시 재요청을 줄이는 StaticFiles"""
+    
+    async def get_response(self, path, scope):
+        response = await super().get_response(path, scope)
+        response.headers["Cache-Control"] = f"public, max-age={STATIC_MAX_AGE}"
+        return response
+
+
 static_path = os.path.join(os.path.dirname(__file__), "static")
 if os.path.exists(static_path):
-    app.mount("/static", StaticFiles(directory=static_path), name="static")
+    app.mount("/static", CachedStaticFiles(directory=static_path, check_dir=False), name="static")
+
+
+@app.on_event("startup")
+async def on_startup():
+    """[advice from AI] 사전 데이터 백그라운드 저장 / 로그 브로드캐스트 태스크 시작"""
+    admin.start_flush_task()
+    admin.start_log_broadcaster()
+
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    """[advice from AI] 남은 사전 변경사항 저장 후 종료"""
+    await admin.stop_log_broadcaster()
+    await admin.stop_flush_task()
+    await admin.close_http_clients()
+    await realtime.close_http_clients()
 
 
 @app.get("/", tags=["root"])
@@ -1,6 +1,6 @@
 # [advice from AI] 자막 관련 Pydantic 모델 정의
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, List
 from enum import Enum
 
@@ -14,6 +14,7 @@ class ProcessStatus(str, Enum):
 
 class SubtitleSegment(BaseModel):
     """자막 세그먼트 모델"""
+    model_config = ConfigDict(extra='forbid')
     id: int
     start_time: float  # 초 단위
     end_time: float
@@ -23,6 +24,7 @@ class SubtitleSegment(BaseModel):
 
 class STTRequest(BaseModel):
     """STT 요청 모델"""
+    model_config = ConfigDict(extra='forbid')
     file_path: str
     language: str = "ko"
     enable_diarization: bool = True  # 화자 분리 활성화
@@ -30,6 +32,7 @@ class STTRequest(BaseModel):
 
 class STTResponse(BaseModel):
     """STT 응답 모델"""
+    model_config = ConfigDict(extra='forbid')
     segments: List[SubtitleSegment]
     status: ProcessStatus
     message: Optional[str] = None
@@ -39,6 +42,7 @@ class STTResponse(BaseModel):
 
 class SubtitleExportRequest(BaseModel):
     """자막 내보내기 요청 모델"""
+    model_config = ConfigDict(extra='forbid')
     segments: List[SubtitleSegment]
     format: str = "srt"  # srt 또는 vtt
     include_speaker: bool = True
@@ -46,6 +50,7 @@ class SubtitleExportRequest(BaseModel):
 
 class HealthResponse(BaseModel):
     """헬스체크 응답 모델"""
+    model_config = ConfigDict(extra='forbid')
     status: str
     stt_api_connected: bool
     version: str
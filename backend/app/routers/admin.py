@@ -5,14 +5,19 @@ JSON 파일 기반으로 비속어 필터, 고유명사 사전, 정부 용어 
 """
 
 import os
+import threading
+import time
 import logging
 import asyncio
-import json
-from typing import List, Set, Dict, Any
-from datetime import datetime
+from typing import List, Set, Dict, Any, Optional, NamedTuple
 from collections import deque
+from itertools import islice
+from types import MappingProxyType
 from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+import orjson
+
+from ..services.stream_limiter import live_stream_limiter, proxy_stream_limiter
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/admin", tags=["admin"])
@@ -23,36 +28,160 @@ router = APIRouter(prefix="/admin", tags=["admin"])
 
 DATA_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "stt_dictionaries.json")
 
-def load_data() -> Dict[str, Any]:
-    """JSON 파일에서 데이터 로드"""
-    try:
-        with open(DATA_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        # 기본 데이터 구조
-        return {
-            'profanity': [],
-            'sensitive': [],
-            'proper_nouns': [],
-            'government_dict': [],
-            'abbreviations': [],
-            'hallucination': [],
-            'subtitle_rules': {
-                'max_lines': 2,
-                'max_chars_per_line': 18,
-                'fade_timeout_ms': 3000,
-                'display_delay_ms': 0,
-                'min_display_ms': 1000,
-                'break_on_sentence_end': True
+# [advice from AI] 자막 규칙 기본값 (읽기 전용 - 사용 시 dict()로 복사)
+_DEFAULT_SUBTITLE_RULES = MappingProxyType({
+    'max_lines': 2,
+    'max_chars_per_line': 18,
+    'fade_timeout_ms': 3000,
+    'display_delay_ms': 0,
+    'min_display_ms': 1000,
+    'break_on_sentence_end': True,
+    'postprocess_enabled': True,  # 기본값: 후처리 ON
+})
+
+# [advice from AI] 파싱된 사전 데이터 캐시 (파일 mtime 변경 시에만 다시 읽음)
+_CACHE: Dict[str, Any] = {"mtime": 0, "data": None, "sets": {}, "stats": None}
+
+def _default_data() -> Dict[str, Any]:
+    """기본 데이터 구조"""
+    return {
+        'profanity': [],
+        'sensitive': [],
+        'proper_nouns': {},
+        'government_dict': {},
+        'abbreviations': {},
+        'hallucination': [],
+        'subtitle_rules': dict(_DEFAULT_SUBTITLE_RULES),
+    }
+
+# [advice from AI] key-value 사전은 {key: value} 형식으로 저장 (O(1) 조회/삭제)
+KV_DICT_KEYS = ('proper_nouns', 'government_dict', 'abbreviations')
+
+def _migrate_kv_lists(data: Dict[str, Any]) -> Dict[str, Any]:
+    """구버전 [{key, value}] 리스트 형식을 {key: value} 형식으로 변환"""
+    for name in KV_DICT_KEYS:
+        items = data.get(name)
+        if isinstance(items, list):
+            data[name] = {
+                item['key']: item['value']
+                for item in items
+                if isinstance(item, dict) and 'key' in item and 'value' in item
             }
-        }
+    return data
 
-def save_data(data: Dict[str, Any]):
-    """JSON 파일에 데이터 저장"""
+def _pattern_index(data: Dict[str, Any], name: str) -> Set[str]:
+    """패턴 리스트(profanity/hallucination)의 set 인덱스 - O(1) 중복 체크용
+    
+    디스크에는 리스트로 저장하고, 리스트 객체가 바뀌면(파일 재로드 등) 다시 만든다.
+    """
+    patterns = data.setdefault(name, [])
+    cached = _CACHE["sets"].get(name)
+    if cached is None or cached[0] is not patterns:
+        cached = (patterns, set(patterns))
+        _CACHE["sets"][name] = cached
+    return cached[1]
+
+def _kv_to_items(kv: Dict[str, str]) -> list:
+    """{key: value} 사전을 API 응답용 [{key, value}] 리스트로 변환"""
+    return [{'key': k, 'value': v} for k, v in kv.items()]
+
+# [advice from AI] 저장 디바운스 - 연속 편집을 한 번의 디스크 쓰기로 병합
+SAVE_DEBOUNCE_SEC = 0.2
+_DIRTY = asyncio.Event()
+_FLUSH_LOCK = asyncio.Lock()
+_FLUSH_TASK: Optional[asyncio.Task] = None
+
+def _read_json() -> Dict[str, Any]:
+    """JSON 파일 읽기 + 구버전 형식 변환"""
+    with open(DATA_FILE, 'rb') as f:
+        return _migrate_kv_lists(orjson.loads(f.read()))
+
+def _has_pending_changes() -> bool:
+    """디스크에 아직 반영되지 않은 메모리 변경 여부"""
+    return _CACHE["data"] is not None and (_DIRTY.is_set() or _FLUSH_LOCK.locked())
+
+async def load_data() -> Dict[str, Any]:
+    """JSON 파일에서 데이터 로드 (mtime 기반 캐싱, 파일 읽기는 스레드에서 수행)"""
+    # [advice from AI] 아직 디스크에 반영되지 않은 변경이 있으면 메모리 데이터가 기준
+    if _has_pending_changes():
+        return _CACHE["data"]
+    
+    try:
+        mtime = os.stat(DATA_FILE).st_mtime_ns
+    except FileNotFoundError:
+        return _default_data()
+    
+    if mtime != _CACHE["mtime"] or _CACHE["data"] is None:
+        data = await asyncio.to_thread(_read_json)
+        # 읽는 동안 다른 요청이 변경했다면 메모리 데이터를 유지
+        if _has_pending_changes():
+            return _CACHE["data"]
+        _CACHE["data"] = data
+        _CACHE["mtime"] = mtime
+    return _CACHE["data"]
+
+def _write_json(data: Dict[str, Any]) -> int:
+    """JSON 파일에 원자적으로 저장 (임시 파일 → os.replace) 후 mtime 반환"""
     os.makedirs(os.path.dirname(DATA_FILE), exist_ok=True)
-    with open(DATA_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-    logger.info(f"💾 데이터 저장 완료: {DATA_FILE}")
+    # [advice from AI] 프로세스별 임시 파일 → os.replace (읽는 쪽은 항상 완성된 파일만 봄)
+    # POC 용도이므로 fsync는 생략
+    tmp_file = f"{DATA_FILE}.{os.getpid()}.tmp"
+    # orjson은 항상 UTF-8로 출력 (ensure_ascii=False와 동일), 키는 모두 문자열
+    payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    with open(tmp_file, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_file, DATA_FILE)
+    return os.stat(DATA_FILE).st_mtime_ns
+
+async def _flush():
+    """캐시된 데이터를 디스크에 기록"""
+    async with _FLUSH_LOCK:
+        if _CACHE["data"] is None or not _DIRTY.is_set():
+            return
+        _DIRTY.clear()
+        _CACHE["mtime"] = await asyncio.to_thread(_write_json, _CACHE["data"])
+    logger.info("💾 데이터 저장 완료: %s", DATA_FILE)
+
+async def _flush_loop():
+    """변경 발생 시 SAVE_DEBOUNCE_SEC 만큼 모았다가 한 번에 저장"""
+    while True:
+        await _DIRTY.wait()
+        await asyncio.sleep(SAVE_DEBOUNCE_SEC)
+        try:
+            await asyncio.shield(_flush())
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("데이터 저장 오류: %s", e)
+
+def start_flush_task():
+    """백그라운드 저장 태스크 시작 (앱 startup에서 호출)"""
+    global _FLUSH_TASK
+    if _FLUSH_TASK is None:
+        _FLUSH_TASK = asyncio.create_task(_flush_loop())
+
+async def stop_flush_task():
+    """백그라운드 저장 태스크 종료 + 남은 변경 저장 (앱 shutdown에서 호출)"""
+    global _FLUSH_TASK
+    if _FLUSH_TASK is not None:
+        _FLUSH_TASK.cancel()
+        try:
+            await _FLUSH_TASK
+        except asyncio.CancelledError:
+            pass
+        _FLUSH_TASK = None
+    await _flush()
+
+async def save_data(data: Dict[str, Any]):
+    """데이터 변경 반영 (디스크 쓰기는 백그라운드에서 병합 처리)"""
+    _CACHE["data"] = data
+    _CACHE["stats"] = None
+    if _FLUSH_TASK is None:
+        # 백그라운드 태스크가 없으면 (CLI 등) 즉시 저장
+        _CACHE["mtime"] = await asyncio.to_thread(_write_json, data)
+        logger.info("💾 데이터 저장 완료: %s", DATA_FILE)
+        return
+    _DIRTY.set()
 
 
 # =============================================================================
@@ -61,6 +190,45 @@ def save_data(data: Dict[str, Any]):
 
 LOG_BUFFER: deque = deque(maxlen=500)
 LOG_CLIENTS: Set[WebSocket] = set()
+# [advice from AI] 워커 스레드의 로그 추가와 백필 스냅샷(list 복사)이 겹치지 않도록 보호
+_LOG_BUFFER_LOCK = threading.Lock()
+
+# [advice from AI] 로그 레코드마다 태스크를 만들지 않고 큐 + 단일 브로드캐스터로 전송
+LOG_QUEUE_SIZE = 1000
+LOG_BATCH_WINDOW_SEC = 0.02  # 20ms 동안 들어온 로그를 한 프레임으로 전송
+LOG_BATCH_MAX = 500
+LOG_SEND_TIMEOUT_SEC = 1.0  # 이 시간 안에 전송되지 않는 클라이언트는 연결 해제
+LOG_FANOUT_CHUNK = 50  # 클라이언트가 많을 때 이 단위로 나눠 보내고 사이에 이벤트 루프 양보
+_LOG_QUEUE: asyncio.Queue = asyncio.Queue(maxsize=LOG_QUEUE_SIZE)
+_LOG_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_LOG_TASK: Optional[asyncio.Task] = None
+
+
+def _fmt_ts(now: Optional[float] = None) -> str:
+    """HH:MM:SS.mmm 형식 시각 (datetime 객체 생성 없이 포맷)"""
+    if now is None:
+        now = time.time()
+    return f"{time.strftime('%H:%M:%S', time.localtime(now))}.{int(now % 1 * 1000):03d}"
+
+
+def _stamp_log_entries(entries) -> None:
+    """emit에서 float로 남긴 timestamp를 전송 직전에 문자열로 변환 (한 번만)"""
+    for entry in entries:
+        ts = entry["timestamp"]
+        if isinstance(ts, float):
+            entry["timestamp"] = _fmt_ts(ts)
+
+
+def _enqueue_log(log_entry: dict):
+    """브로드캐스트 큐에 추가 (가득 차면 가장 오래된 항목 버림)"""
+    try:
+        _LOG_QUEUE.put_nowait(log_entry)
+    except asyncio.QueueFull:
+        try:
+            _LOG_QUEUE.get_nowait()
+        except asyncio.QueueEmpty:
+            pass
+        _LOG_QUEUE.put_nowait(log_entry)
 
 
 class WebSocketLogHandler(logging.Handler):
@@ -69,37 +237,96 @@ class WebSocketLogHandler(logging.Handler):
     def emit(self, record):
         try:
             log_entry = {
-                "timestamp": datetime.now().strftime("%H:%M:%S.%f")[:-3],
+                # [advice from AI] 포맷은 실제 전송 시점에 수행 (클라이언트가 없으면 생략)
+                "timestamp": record.created,
                 "level": record.levelname,
                 "logger": record.name,
                 "message": self.format(record),
             }
-            LOG_BUFFER.append(log_entry)
-            if LOG_CLIENTS:
-                asyncio.create_task(self._broadcast(log_entry))
+            with _LOG_BUFFER_LOCK:
+                LOG_BUFFER.append(log_entry)
+            if LOG_CLIENTS and _LOG_LOOP is not None:
+                try:
+                    running_loop = asyncio.get_running_loop()
+                except RuntimeError:
+                    running_loop = None
+                if running_loop is _LOG_LOOP:
+                    _enqueue_log(log_entry)
+                else:
+                    # 이벤트 루프 밖(워커 스레드)에서 발생한 로그
+                    _LOG_LOOP.call_soon_threadsafe(_enqueue_log, log_entry)
         except Exception:
             pass
-    
-    async def _broadcast(self, log_entry: dict):
-        disconnected = set()
-        for client in LOG_CLIENTS:
+
+
+async def _log_broadcaster():
+    """큐에서 로그를 모아(LOG_BATCH_WINDOW_SEC) 한 번만 직렬화하여 모든 클라이언트에 전송"""
+    loop = asyncio.get_running_loop()
+    while True:
+        entries = [await _LOG_QUEUE.get()]
+        deadline = loop.time() + LOG_BATCH_WINDOW_SEC
+        while len(entries) < LOG_BATCH_MAX:
             try:
-                await client.send_json(log_entry)
+                entries.append(_LOG_QUEUE.get_nowait())
+            except asyncio.QueueEmpty:
+                if loop.time() >= deadline:
+                    break
+                await asyncio.sleep(0.005)
+        if not LOG_CLIENTS:
+            continue
+        _stamp_log_entries(entries)
+        payload = orjson.dumps({"batch": entries})
+        disconnected: Set[WebSocket] = set()
+        
+        async def _send(client: WebSocket):
+            # 느린 클라이언트가 전체 브로드캐스트를 막지 않도록 전송 타임아웃 적용
+            try:
+                await asyncio.wait_for(client.send_bytes(payload), LOG_SEND_TIMEOUT_SEC)
             except Exception:
                 disconnected.add(client)
-        for client in disconnected:
-            LOG_CLIENTS.discard(client)
+        
+        # 첫 await 전에 스냅샷 - 전송 중 연결/해제가 있어도 순회에 영향 없음
+        clients = tuple(LOG_CLIENTS)
+        for i in range(0, len(clients), LOG_FANOUT_CHUNK):
+            if i:
+                await asyncio.sleep(0)
+            await asyncio.gather(*(_send(client) for client in clients[i:i + LOG_FANOUT_CHUNK]))
+        LOG_CLIENTS.difference_update(disconnected)
+
+
+def start_log_broadcaster():
+    """로그 브로드캐스터 태스크 시작 (앱 startup에서 호출)"""
+    global _LOG_LOOP, _LOG_TASK
+    if _LOG_TASK is None:
+        _LOG_LOOP = asyncio.get_running_loop()
+        _LOG_TASK = asyncio.create_task(_log_broadcaster())
+
+
+async def stop_log_broadcaster():
+    """로그 브로드캐스터 태스크 종료 (앱 shutdown에서 호출)"""
+    global _LOG_LOOP, _LOG_TASK
+    if _LOG_TASK is not None:
+        _LOG_TASK.cancel()
+        try:
+            await _LOG_TASK
+        except asyncio.CancelledError:
+            pass
+        _LOG_TASK = None
+    _LOG_LOOP = None
+
+
+_HANDLER_INSTALLED = False
 
 
 def setup_log_handler():
+    global _HANDLER_INSTALLED
+    if _HANDLER_INSTALLED:
+        return
+    _HANDLER_INSTALLED = True
     handler = WebSocketLogHandler()
     handler.setFormatter(logging.Formatter('%(message)s'))
     handler.setLevel(logging.INFO)
-    root_logger = logging.getLogger()
-    for h in root_logger.handlers:
-        if isinstance(h, WebSocketLogHandler):
-            return
-    root_logger.addHandler(handler)
+    logging.getLogger().addHandler(handler)
     logger.info("📡 실시간 로그 스트리밍 활성화")
 
 setup_log_handler()
@@ -110,13 +337,16 @@ setup_log_handler()
 # =============================================================================
 
 class DictionaryItem(BaseModel):
+    model_config = ConfigDict(extra='forbid')
     key: str
     value: str
 
 class FilterPattern(BaseModel):
+    model_config = ConfigDict(extra='forbid')
     pattern: str
 
 class DictionaryStats(BaseModel):
+    model_config = ConfigDict(extra='forbid')
     profanity_count: int
     sensitive_count: int
     proper_noun_count: int
@@ -125,11 +355,13 @@ class DictionaryStats(BaseModel):
     hallucination_count: int
 
 class DictionaryResponse(BaseModel):
+    model_config = ConfigDict(extra='forbid')
     dictionary_type: str
     items: list
     total: int
 
 class SubtitleRules(BaseModel):
+    model_config = ConfigDict(extra='forbid')
     max_lines: int = 2
     max_chars_per_line: int = 18
     fade_timeout_ms: int = 3000
@@ -146,8 +378,12 @@ class SubtitleRules(BaseModel):
 @router.get("/stats", response_model=DictionaryStats)
 async def get_dictionary_stats():
     """모든 사전/필터 통계 조회"""
-    data = load_data()
-    return DictionaryStats(
+    data = await load_data()
+    # [advice from AI] 같은 데이터 객체에 대한 통계는 재사용 (save_data/파일 재로드 시 무효화)
+    cached = _CACHE["stats"]
+    if cached is not None and cached[0] is data:
+        return cached[1]
+    stats = DictionaryStats.model_construct(
         profanity_count=len(data.get('profanity', [])),
         sensitive_count=len(data.get('sensitive', [])),
         proper_noun_count=len(data.get('proper_nouns', [])),
@@ -155,241 +391,156 @@ async def get_dictionary_stats():
         abbreviation_count=len(data.get('abbreviations', [])),
         hallucination_count=len(data.get('hallucination', [])),
     )
+    _CACHE["stats"] = (data, stats)
+    return stats
 
 
 # =============================================================================
-# 비속어 필터 관리
+# [advice from AI] 사전/필터 CRUD - 테이블 기반으로 라우트 생성
+# 비속어/할루시네이션: 문자열 패턴 리스트, 고유명사/정부 용어/약어: {key: value} 사전
 # =============================================================================
 
-@router.get("/profanity", response_model=DictionaryResponse)
-async def get_profanity_patterns():
-    """비속어 패턴 목록 조회"""
-    data = load_data()
-    items = data.get('profanity', [])
-    return DictionaryResponse(
-        dictionary_type="profanity",
-        items=items,
-        total=len(items),
-    )
-
-@router.post("/profanity")
-async def add_profanity_pattern(pattern: FilterPattern):
-    """비속어 패턴 추가"""
-    data = load_data()
-    if pattern.pattern in data.get('profanity', []):
-        raise HTTPException(status_code=400, detail="이미 존재하는 패턴입니다")
+class DictionarySpec(NamedTuple):
+    path: str             # URL 경로 (/admin/{path})
+    data_key: str         # JSON 데이터 키
+    dictionary_type: str  # 응답의 dictionary_type
+    kind: str             # "pattern" | "kv"
+    label: str            # 로그/문서용 이름
+    delete_param: str = "{key}"  # 삭제 경로 파라미터 ("{key:path}"는 '/' 포함 허용)
+    read_only: bool = False
+
+
+DICTIONARY_SPECS = [
+    DictionarySpec("profanity", "profanity", "profanity", "pattern", "비속어 패턴"),
+    DictionarySpec("proper-nouns", "proper_nouns", "proper_noun", "kv", "고유명사"),
+    DictionarySpec("government-dict", "government_dict", "government", "kv", "정부 용어"),
+    DictionarySpec("abbreviations", "abbreviations", "abbreviation", "kv", "약어"),
+    DictionarySpec("hallucination", "hallucination", "hallucination", "pattern", "할루시네이션 패턴", "{key:path}"),
+    DictionarySpec("sensitive-patterns", "sensitive", "sensitive", "pattern", "민감정보 패턴", read_only=True),
+]
+
+
+def _register_dictionary_routes(spec: DictionarySpec):
+    """사전 하나에 대한 조회/추가/삭제 라우트 등록"""
+    name = spec.data_key
+    is_kv = spec.kind == "kv"
     
-    data.setdefault('profanity', []).append(pattern.pattern)
-    save_data(data)
-    logger.info(f"✅ 비속어 패턴 추가: {pattern.pattern}")
-    return {"message": "추가 완료", "total": len(data['profanity'])}
-
-@router.delete("/profanity/{pattern}")
-async def delete_profanity_pattern(pattern: str):
-    """비속어 패턴 삭제"""
-    data = load_data()
-    if pattern not in data.get('profanity', []):
-        raise HTTPException(status_code=404, detail="패턴을 찾을 수 없습니다")
+    async def get_items():
+        data = await load_data()
+        if is_kv:
+            items = _kv_to_items(data.get(name, {}))
+        else:
+            items = data.get(name, [])
+        # [advice from AI] load_data의 신뢰된 데이터이므로 생성 시 검증 생략
+        return DictionaryResponse.model_construct(
+            dictionary_type=spec.dictionary_type,
+            items=items,
+            total=len(items),
+        )
     
-    data['profanity'].remove(pattern)
-    save_data(data)
-    logger.info(f"🗑️ 비속어 패턴 삭제: {pattern}")
-    return {"message": "삭제 완료", "total": len(data['profanity'])}
-
-
-# =============================================================================
-# 고유명사 사전 관리
-# =============================================================================
-
-@router.get("/proper-nouns", response_model=DictionaryResponse)
-async def get_proper_nouns():
-    """고유명사 사전 조회"""
-    data = load_data()
-    items = data.get('proper_nouns', [])
-    return DictionaryResponse(
-        dictionary_type="proper_noun",
-        items=items,
-        total=len(items),
+    router.add_api_route(
+        f"/{spec.path}", get_items, methods=["GET"],
+        response_model=DictionaryResponse,
+        name=f"get_{name}", summary=f"{spec.label} 조회",
     )
-
-@router.post("/proper-nouns")
-async def add_proper_noun(item: DictionaryItem):
-    """고유명사 추가"""
-    data = load_data()
-    proper_nouns = data.setdefault('proper_nouns', [])
-    
-    # 중복 체크
-    for existing in proper_nouns:
-        if existing.get('key') == item.key:
-            raise HTTPException(status_code=400, detail="이미 존재하는 항목입니다")
-    
-    proper_nouns.append({'key': item.key, 'value': item.value})
-    save_data(data)
-    logger.info(f"✅ 고유명사 추가: {item.key} → {item.value}")
-    return {"message": "추가 완료", "total": len(proper_nouns)}
-
-@router.delete("/proper-nouns/{key}")
-async def delete_proper_noun(key: str):
-    """고유명사 삭제"""
-    data = load_data()
-    proper_nouns = data.get('proper_nouns', [])
+    if spec.read_only:
+        return
     
-    for i, item in enumerate(proper_nouns):
-        if item.get('key') == key:
-            proper_nouns.pop(i)
-            save_data(data)
-            logger.info(f"🗑️ 고유명사 삭제: {key}")
-            return {"message": "삭제 완료", "total": len(proper_nouns)}
+    if is_kv:
+        async def add_item(item: DictionaryItem):
+            data = await load_data()
+            kv = data.setdefault(name, {})
+            
+            # 중복 체크
+            if item.key in kv:
+                raise HTTPException(status_code=400, detail="이미 존재하는 항목입니다")
+            
+            kv[item.key] = item.value
+            await save_data(data)
+            logger.info("✅ %s 추가: %s → %s", spec.label, item.key, item.value)
+            return {"message": "추가 완료", "total": len(kv)}
+        
+        async def delete_item(key: str):
+            data = await load_data()
+            kv = data.get(name, {})
+            if key not in kv:
+                raise HTTPException(status_code=404, detail="항목을 찾을 수 없습니다")
+            
+            del kv[key]
+            await save_data(data)
+            logger.info("🗑️ %s 삭제: %s", spec.label, key)
+            return {"message": "삭제 완료", "total": len(kv)}
+        
+        async def add_items_bulk(items: List[DictionaryItem]):
+            data = await load_data()
+            kv = data.setdefault(name, {})
+            added = 0
+            for item in items:
+                if item.key not in kv:
+                    kv[item.key] = item.value
+                    added += 1
+            
+            if added:
+                await save_data(data)
+            logger.info("✅ %s 일괄 추가: %s개 (중복 %s개 제외)", spec.label, added, len(items) - added)
+            return {"message": "추가 완료", "added": added, "skipped": len(items) - added, "total": len(kv)}
+    else:
+        async def add_item(pattern: FilterPattern):
+            data = await load_data()
+            index = _pattern_index(data, name)
+            if pattern.pattern in index:
+                raise HTTPException(status_code=400, detail="이미 존재하는 패턴입니다")
+            
+            data[name].append(pattern.pattern)
+            index.add(pattern.pattern)
+            await save_data(data)
+            logger.info("✅ %s 추가: %s", spec.label, pattern.pattern)
+            return {"message": "추가 완료", "total": len(data[name])}
+        
+        async def delete_item(key: str):
+            data = await load_data()
+            index = _pattern_index(data, name)
+            if key not in index:
+                raise HTTPException(status_code=404, detail="패턴을 찾을 수 없습니다")
+            
+            data[name].remove(key)
+            index.discard(key)
+            await save_data(data)
+            logger.info("🗑️ %s 삭제: %s", spec.label, key)
+            return {"message": "삭제 완료", "total": len(data[name])}
+        
+        async def add_items_bulk(patterns: List[FilterPattern]):
+            data = await load_data()
+            index = _pattern_index(data, name)
+            added = 0
+            for pattern in patterns:
+                if pattern.pattern not in index:
+                    data[name].append(pattern.pattern)
+                    index.add(pattern.pattern)
+                    added += 1
+            
+            if added:
+                await save_data(data)
+            logger.info("✅ %s 일괄 추가: %s개 (중복 %s개 제외)", spec.label, added, len(patterns) - added)
+            return {"message": "추가 완료", "added": added, "skipped": len(patterns) - added, "total": len(data[name])}
     
-    raise HTTPException(status_code=404, detail="항목을 찾을 수 없습니다")
-
-
-# =============================================================================
-# 정부 용어 사전 관리
-# =============================================================================
-
-@router.get("/government-dict", response_model=DictionaryResponse)
-async def get_government_dict():
-    """정부 용어 사전 조회"""
-    data = load_data()
-    items = data.get('government_dict', [])
-    return DictionaryResponse(
-        dictionary_type="government",
-        items=items,
-        total=len(items),
+    router.add_api_route(
+        f"/{spec.path}", add_item, methods=["POST"],
+        name=f"add_{name}", summary=f"{spec.label} 추가",
     )
-
-@router.post("/government-dict")
-async def add_government_term(item: DictionaryItem):
-    """정부 용어 추가"""
-    data = load_data()
-    govt_dict = data.setdefault('government_dict', [])
-    
-    for existing in govt_dict:
-        if existing.get('key') == item.key:
-            raise HTTPException(status_code=400, detail="이미 존재하는 항목입니다")
-    
-    govt_dict.append({'key': item.key, 'value': item.value})
-    save_data(data)
-    logger.info(f"✅ 정부 용어 추가: {item.key} → {item.value}")
-    return {"message": "추가 완료", "total": len(govt_dict)}
-
-@router.delete("/government-dict/{key}")
-async def delete_government_term(key: str):
-    """정부 용어 삭제"""
-    data = load_data()
-    govt_dict = data.get('government_dict', [])
-    
-    for i, item in enumerate(govt_dict):
-        if item.get('key') == key:
-            govt_dict.pop(i)
-            save_data(data)
-            logger.info(f"🗑️ 정부 용어 삭제: {key}")
-            return {"message": "삭제 완료", "total": len(govt_dict)}
-    
-    raise HTTPException(status_code=404, detail="항목을 찾을 수 없습니다")
-
-
-# =============================================================================
-# 약어 사전 관리
-# =============================================================================
-
-@router.get("/abbreviations", response_model=DictionaryResponse)
-async def get_abbreviations():
-    """약어 사전 조회"""
-    data = load_data()
-    items = data.get('abbreviations', [])
-    return DictionaryResponse(
-        dictionary_type="abbreviation",
-        items=items,
-        total=len(items),
+    # [advice from AI] 여러 항목을 한 번에 반영하고 저장도 한 번만 수행
+    router.add_api_route(
+        f"/{spec.path}/bulk", add_items_bulk, methods=["POST"],
+        name=f"add_{name}_bulk", summary=f"{spec.label} 일괄 추가",
     )
-
-@router.post("/abbreviations")
-async def add_abbreviation(item: DictionaryItem):
-    """약어 추가"""
-    data = load_data()
-    abbr_list = data.setdefault('abbreviations', [])
-    
-    for existing in abbr_list:
-        if existing.get('key') == item.key:
-            raise HTTPException(status_code=400, detail="이미 존재하는 항목입니다")
-    
-    abbr_list.append({'key': item.key, 'value': item.value})
-    save_data(data)
-    logger.info(f"✅ 약어 추가: {item.key} → {item.value}")
-    return {"message": "추가 완료", "total": len(abbr_list)}
-
-@router.delete("/abbreviations/{key}")
-async def delete_abbreviation(key: str):
-    """약어 삭제"""
-    data = load_data()
-    abbr_list = data.get('abbreviations', [])
-    
-    for i, item in enumerate(abbr_list):
-        if item.get('key') == key:
-            abbr_list.pop(i)
-            save_data(data)
-            logger.info(f"🗑️ 약어 삭제: {key}")
-            return {"message": "삭제 완료", "total": len(abbr_list)}
-    
-    raise HTTPException(status_code=404, detail="항목을 찾을 수 없습니다")
-
-
-# =============================================================================
-# 할루시네이션 패턴 관리
-# =============================================================================
-
-@router.get("/hallucination", response_model=DictionaryResponse)
-async def get_hallucination_patterns():
-    """할루시네이션 패턴 조회"""
-    data = load_data()
-    items = data.get('hallucination', [])
-    return DictionaryResponse(
-        dictionary_type="hallucination",
-        items=items,
-        total=len(items),
+    router.add_api_route(
+        f"/{spec.path}/{spec.delete_param}", delete_item, methods=["DELETE"],
+        name=f"delete_{name}", summary=f"{spec.label} 삭제",
     )
 
-@router.post("/hallucination")
-async def add_hallucination_pattern(pattern: FilterPattern):
-    """할루시네이션 패턴 추가"""
-    data = load_data()
-    if pattern.pattern in data.get('hallucination', []):
-        raise HTTPException(status_code=400, detail="이미 존재하는 패턴입니다")
-    
-    data.setdefault('hallucination', []).append(pattern.pattern)
-    save_data(data)
-    logger.info(f"✅ 할루시네이션 패턴 추가: {pattern.pattern}")
-    return {"message": "추가 완료", "total": len(data['hallucination'])}
-    
-@router.delete("/hallucination/{pattern:path}")
-async def delete_hallucination_pattern(pattern: str):
-    """할루시네이션 패턴 삭제"""
-    data = load_data()
-    if pattern not in data.get('hallucination', []):
-        raise HTTPException(status_code=404, detail="패턴을 찾을 수 없습니다")
-    
-    data['hallucination'].remove(pattern)
-    save_data(data)
-    logger.info(f"🗑️ 할루시네이션 패턴 삭제: {pattern}")
-    return {"message": "삭제 완료", "total": len(data['hallucination'])}
 
-
-# =============================================================================
-# 민감정보 패턴 (읽기 전용)
-# =============================================================================
-
-@router.get("/sensitive-patterns", response_model=DictionaryResponse)
-async def get_sensitive_patterns():
-    """민감정보 패턴 조회 (읽기 전용)"""
-    data = load_data()
-    items = data.get('sensitive', [])
-    return DictionaryResponse(
-        dictionary_type="sensitive",
-        items=items,
-        total=len(items),
-    )
+for _spec in DICTIONARY_SPECS:
+    _register_dictionary_routes(_spec)
 
 
 # =============================================================================
@@ -399,40 +550,25 @@ async def get_sensitive_patterns():
 @router.get("/subtitle-rules")
 async def get_subtitle_rules():
     """자막 규칙 조회"""
-    data = load_data()
-    return data.get('subtitle_rules', {
-        'max_lines': 2,
-        'max_chars_per_line': 18,
-        'fade_timeout_ms': 3000,
-        'display_delay_ms': 0,
-        'min_display_ms': 1000,
-        'break_on_sentence_end': True,
-        'postprocess_enabled': True  # [advice from AI] 기본값: 후처리 ON
-    })
+    data = await load_data()
+    return data.get('subtitle_rules') or dict(_DEFAULT_SUBTITLE_RULES)
 
 @router.post("/subtitle-rules")
 async def save_subtitle_rules(rules: SubtitleRules):
     """자막 규칙 저장"""
-    data = load_data()
-    data['subtitle_rules'] = rules.dict()
-    save_data(data)
-    logger.info(f"✅ 자막 규칙 저장: {rules.dict()}")
+    data = await load_data()
+    payload = rules.model_dump()
+    data['subtitle_rules'] = payload
+    await save_data(data)
+    logger.info("✅ 자막 규칙 저장: %s", payload)
     return {"message": "저장 완료"}
 
 @router.post("/subtitle-rules/reset")
 async def reset_subtitle_rules():
     """자막 규칙 초기화"""
-    data = load_data()
-    data['subtitle_rules'] = {
-        'max_lines': 2,
-        'max_chars_per_line': 18,
-        'fade_timeout_ms': 3000,
-        'display_delay_ms': 0,
-        'min_display_ms': 1000,
-        'break_on_sentence_end': True,
-        'postprocess_enabled': True  # [advice from AI] 기본값: 후처리 ON
-    }
-    save_data(data)
+    data = await load_data()
+    data['subtitle_rules'] = dict(_DEFAULT_SUBTITLE_RULES)
+    await save_data(data)
     logger.info("🔄 자막 규칙 초기화")
     return data['subtitle_rules']
 
@@ -446,12 +582,15 @@ async def websocket_logs(websocket: WebSocket):
     """실시간 로그 WebSocket"""
     await websocket.accept()
     LOG_CLIENTS.add(websocket)
-    logger.info(f"📡 로그 클라이언트 연결: 현재 {len(LOG_CLIENTS)}개")
+    logger.info("📡 로그 클라이언트 연결: 현재 %s개", len(LOG_CLIENTS))
     
     try:
-        # 기존 로그 전송
-        for log in LOG_BUFFER:
-            await websocket.send_json(log)
+        # 기존 로그 전송 (한 프레임으로 묶어서)
+        with _LOG_BUFFER_LOCK:
+            snapshot = list(LOG_BUFFER)
+        if snapshot:
+            _stamp_log_entries(snapshot)
+            await websocket.send_bytes(orjson.dumps({"backfill": snapshot}))
         
         # 연결 유지
         while True:
@@ -465,7 +604,7 @@ async def websocket_logs(websocket: WebSocket):
         pass
     finally:
         LOG_CLIENTS.discard(websocket)
-        logger.info(f"📡 로그 클라이언트 해제: 현재 {len(LOG_CLIENTS)}개")
+        logger.info("📡 로그 클라이언트 해제: 현재 %s개", len(LOG_CLIENTS))
 
 
 # =============================================================================
@@ -478,6 +617,7 @@ MAX_LOG_LINES = 500  # 최대 500줄 유지
 
 class STTLogEntry(BaseModel):
     """STT 로그 항목"""
+    model_config = ConfigDict(extra='forbid')
     timestamp: str = ""
     log_type: str  # WHISPER_RAW, SUBTITLE_LIST, DISPLAY, BUFFER
     raw_text: str = ""
@@ -485,63 +625,124 @@ class STTLogEntry(BaseModel):
     video_time: float = 0
     extra: dict = {}
 
-def append_stt_log(entry: STTLogEntry):
-    """STT 로그를 파일에 추가 (최대 줄 수 유지)"""
-    try:
-        # 기존 로그 읽기
-        lines = []
-        if os.path.exists(STT_LOG_FILE):
+os.makedirs(os.path.dirname(STT_LOG_FILE), exist_ok=True)
+
+# [advice from AI] 매 추가마다 전체 파일을 다시 쓰지 않고, N회 추가마다 한 번만 최대 줄 수로 정리
+STT_LOG_TRUNCATE_EVERY = 200
+_STT_LOG_APPENDS = 0
+_STT_LOG_LINES = 0  # 현재 파일 줄 수
+# [advice from AI] 최근 MAX_LOG_LINES 줄을 메모리 링 버퍼로 유지 - 조회/정리 시 파일을 다시 읽지 않음
+# (None이면 아직 파일에서 불러오지 않은 상태)
+_STT_LOG_TAIL: Optional[deque] = None
+# [advice from AI] 파일 I/O는 워커 스레드에서 실행되므로 추가/정리/삭제를 직렬화
+_STT_LOG_LOCK = threading.Lock()
+
+STT_LOG_TEXT_MAX = 80  # 로그 한 줄에 남길 원본/후처리 텍스트 최대 길이
+
+def _clip(text: str) -> str:
+    """STT_LOG_TEXT_MAX 글자로 자르기 (짧은 문자열은 그대로)"""
+    return text if len(text) <= STT_LOG_TEXT_MAX else text[:STT_LOG_TEXT_MAX]
+
+def _format_stt_log_line(entry: STTLogEntry, default_ts: str) -> str:
+    """STT 로그 항목을 한 줄 문자열로 변환"""
+    timestamp = entry.timestamp or default_ts
+    log_line = f"[{timestamp}] [{entry.log_type}] T={entry.video_time:.1f}s | 원본: {_clip(entry.raw_text)} | 후처리: {_clip(entry.processed_text)}"
+    if entry.extra:
+        log_line += f" | {orjson.dumps(entry.extra).decode()}"
+    return log_line + "\n"
+
+def _ensure_stt_log_tail() -> deque:
+    """메모리 링 버퍼가 없으면 파일에서 최근 줄과 전체 줄 수를 한 번 읽어 초기화 (락 안에서 호출)"""
+    global _STT_LOG_TAIL, _STT_LOG_LINES
+    if _STT_LOG_TAIL is None:
+        tail: deque = deque(maxlen=MAX_LOG_LINES)
+        total = 0
+        try:
             with open(STT_LOG_FILE, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-        
-        # 새 로그 추가
-        timestamp = entry.timestamp or datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        log_line = f"[{timestamp}] [{entry.log_type}] T={entry.video_time:.1f}s | 원본: {entry.raw_text[:80]} | 후처리: {entry.processed_text[:80]}"
-        if entry.extra:
-            log_line += f" | {json.dumps(entry.extra, ensure_ascii=False)}"
-        log_line += "\n"
-        lines.append(log_line)
-        
-        # 최대 줄 수 유지
-        if len(lines) > MAX_LOG_LINES:
-            lines = lines[-MAX_LOG_LINES:]
-        
-        # 파일 저장
-        os.makedirs(os.path.dirname(STT_LOG_FILE), exist_ok=True)
-        with open(STT_LOG_FILE, 'w', encoding='utf-8') as f:
-            f.writelines(lines)
+                for line in f:
+                    total += 1
+                    tail.append(line)
+        except FileNotFoundError:
+            pass
+        _STT_LOG_TAIL = tail
+        _STT_LOG_LINES = total
+    return _STT_LOG_TAIL
+
+def _truncate_stt_log():
+    """최근 MAX_LOG_LINES 줄만 남기고 정리 (메모리 링 버퍼 내용으로 파일 재작성)"""
+    global _STT_LOG_LINES
+    tail = _ensure_stt_log_tail()
+    with open(STT_LOG_FILE, 'w', encoding='utf-8') as f:
+        f.writelines(tail)
+    _STT_LOG_LINES = len(tail)
+
+def append_stt_logs_bulk(entries: List[STTLogEntry]):
+    """여러 STT 로그를 한 번의 쓰기로 추가 (주기적으로 최대 줄 수 유지)"""
+    global _STT_LOG_APPENDS, _STT_LOG_LINES
+    if not entries:
+        return
+    # 타임스탬프가 없는 항목은 배치 수신 시각 하나로 통일
+    default_ts = _fmt_ts()
+    new_lines = [_format_stt_log_line(entry, default_ts) for entry in entries]
+    try:
+        with _STT_LOG_LOCK:
+            tail = _ensure_stt_log_tail()
+            with open(STT_LOG_FILE, 'a', encoding='utf-8') as f:
+                f.write(''.join(new_lines))
+            tail.extend(new_lines)
+            _STT_LOG_LINES += len(new_lines)
+            
+            # [advice from AI] 배치 중 정리 주기를 넘었으면 마지막에 한 번만 정리
+            before = _STT_LOG_APPENDS
+            _STT_LOG_APPENDS += len(entries)
+            if before // STT_LOG_TRUNCATE_EVERY != _STT_LOG_APPENDS // STT_LOG_TRUNCATE_EVERY:
+                _truncate_stt_log()
             
     except Exception as e:
-        logger.error(f"STT 로그 저장 오류: {e}")
+        logger.error("STT 로그 저장 오류: %s", e)
+
+def append_stt_log(entry: STTLogEntry):
+    """STT 로그를 파일 끝에 추가"""
+    append_stt_logs_bulk([entry])
+
+def _read_stt_log_tail(lines: int):
+    """최근 N줄과 전체 줄 수 반환 (메모리 링 버퍼에서 조회)"""
+    with _STT_LOG_LOCK:
+        tail = _ensure_stt_log_tail()
+        start = len(tail) - lines if 0 < lines < len(tail) else 0
+        recent = list(islice(tail, start, None))
+        total = _STT_LOG_LINES
+    return [line.strip() for line in recent], total
+
+def _remove_stt_log():
+    """STT 로그 파일 삭제"""
+    global _STT_LOG_TAIL, _STT_LOG_LINES
+    with _STT_LOG_LOCK:
+        if os.path.exists(STT_LOG_FILE):
+            os.remove(STT_LOG_FILE)
+        _STT_LOG_TAIL = deque(maxlen=MAX_LOG_LINES)
+        _STT_LOG_LINES = 0
 
 @router.post("/stt-log")
 async def add_stt_log(entry: STTLogEntry):
     """프론트엔드에서 STT 로그 수신"""
-    append_stt_log(entry)
+    await asyncio.to_thread(append_stt_log, entry)
     return {"status": "ok"}
 
 @router.post("/stt-log/batch")
 async def add_stt_logs_batch(entries: List[STTLogEntry]):
     """프론트엔드에서 STT 로그 일괄 수신"""
-    for entry in entries:
-        append_stt_log(entry)
+    await asyncio.to_thread(append_stt_logs_bulk, entries)
     return {"status": "ok", "count": len(entries)}
 
 @router.get("/stt-log")
 async def get_stt_log(lines: int = 100):
     """STT 디버그 로그 조회"""
     try:
-        if not os.path.exists(STT_LOG_FILE):
-            return {"logs": [], "total_lines": 0}
-        
-        with open(STT_LOG_FILE, 'r', encoding='utf-8') as f:
-            all_lines = f.readlines()
-        
-        # 최근 N줄 반환
-        recent_lines = all_lines[-lines:] if len(all_lines) > lines else all_lines
+        logs, total_lines = await asyncio.to_thread(_read_stt_log_tail, lines)
         return {
-            "logs": [line.strip() for line in recent_lines],
-            "total_lines": len(all_lines)
+            "logs": logs,
+            "total_lines": total_lines
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -550,8 +751,7 @@ async def get_stt_log(lines: int = 100):
 async def clear_stt_log():
     """STT 디버그 로그 초기화"""
     try:
-        if os.path.exists(STT_LOG_FILE):
-            os.remove(STT_LOG_FILE)
+        await asyncio.to_thread(_remove_stt_log)
         return {"status": "cleared"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -560,20 +760,52 @@ async def clear_stt_log():
 # [advice from AI] ★★★ WhisperLiveKit (STT) 관리 API ★★★
 # =============================================================================
 
-import subprocess
 import httpx
 
 # WhisperLiveKit 컨테이너 이름 및 내부 URL
 WHISPER_CONTAINER_NAME = "ktv-whisper-livekit"
 WHISPER_INTERNAL_URL = "http://whisper-livekit:8000"
 
-@router.get("/whisper/health")
-async def whisper_health_check():
-    """
-    WhisperLiveKit 서버 헬스체크
-    - 컨테이너 상태 확인
-    - WebSocket 서버 응답 확인
-    """
+# [advice from AI] docker CLI를 fork하지 않고 Docker Engine API를 유닉스 소켓으로 직접 호출
+DOCKER_SOCKET = "/var/run/docker.sock"
+_DOCKER_CLIENT: Optional[httpx.AsyncClient] = None
+# [advice from AI] 헬스체크용 HTTP 클라이언트도 프로세스 전체에서 재사용 (keep-alive 유지)
+_HTTP_CLIENT: Optional[httpx.AsyncClient] = None
+
+def _docker_client() -> httpx.AsyncClient:
+    """Docker Engine API 클라이언트 (연결 재사용)"""
+    global _DOCKER_CLIENT
+    if _DOCKER_CLIENT is None:
+        _DOCKER_CLIENT = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(uds=DOCKER_SOCKET),
+            base_url="http://docker",
+            timeout=5.0,
+        )
+    return _DOCKER_CLIENT
+
+def _http_client() -> httpx.AsyncClient:
+    """WhisperLiveKit HTTP 클라이언트 (연결 재사용)"""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None:
+        _HTTP_CLIENT = httpx.AsyncClient(timeout=5.0)
+    return _HTTP_CLIENT
+
+async def close_http_clients():
+    """공유 HTTP 클라이언트 종료 (앱 shutdown에서 호출)"""
+    global _DOCKER_CLIENT, _HTTP_CLIENT
+    if _DOCKER_CLIENT is not None:
+        await _DOCKER_CLIENT.aclose()
+        _DOCKER_CLIENT = None
+    if _HTTP_CLIENT is not None:
+        await _HTTP_CLIENT.aclose()
+        _HTTP_CLIENT = None
+
+# [advice from AI] 헬스체크 결과 캐시 - 여러 탭의 폴링이 docker 프로세스를 매번 띄우지 않도록
+WHISPER_HEALTH_TTL_SEC = 2.0
+_HEALTH_CACHE: Dict[str, Any] = {"ts": 0.0, "value": None, "task": None}
+
+async def _check_whisper_health() -> Dict[str, Any]:
+    """컨테이너 상태 + HTTP 응답 확인"""
     result = {
         "container_running": False,
         "server_responding": False,
@@ -583,19 +815,15 @@ async def whisper_health_check():
     
     # 1. 컨테이너 상태 확인
     try:
-        container_check = subprocess.run(
-            ["docker", "inspect", "-f", "{{.State.Running}}", WHISPER_CONTAINER_NAME],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if container_check.returncode == 0 and container_check.stdout.strip() == "true":
+        response = await _docker_client().get(f"/containers/{WHISPER_CONTAINER_NAME}/json")
+        running = response.status_code == 200 and response.json().get("State", {}).get("Running") is True
+        if running:
             result["container_running"] = True
         else:
             result["status"] = "stopped"
             result["message"] = "WhisperLiveKit 컨테이너가 중지됨"
             return result
-    except subprocess.TimeoutExpired:
+    except httpx.TimeoutException:
         result["status"] = "error"
         result["message"] = "Docker 명령 타임아웃"
         return result
@@ -606,15 +834,14 @@ async def whisper_health_check():
     
     # 2. HTTP 응답 확인 (WebSocket 서버의 HTTP 핸들러)
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(WHISPER_INTERNAL_URL)
-            if response.status_code == 200:
-                result["server_responding"] = True
-                result["status"] = "healthy"
-                result["message"] = "WhisperLiveKit 정상 작동 중"
-            else:
-                result["status"] = "degraded"
-                result["message"] = f"HTTP 응답 코드: {response.status_code}"
+        response = await _http_client().get(WHISPER_INTERNAL_URL)
+        if response.status_code == 200:
+            result["server_responding"] = True
+            result["status"] = "healthy"
+            result["message"] = "WhisperLiveKit 정상 작동 중"
+        else:
+            result["status"] = "degraded"
+            result["message"] = f"HTTP 응답 코드: {response.status_code}"
     except httpx.TimeoutException:
         result["status"] = "degraded"
         result["message"] = "서버 응답 타임아웃 (컨테이너는 실행 중)"
@@ -624,6 +851,34 @@ async def whisper_health_check():
     
     return result
 
+async def _refresh_whisper_health() -> Dict[str, Any]:
+    """헬스체크 실행 후 캐시 갱신"""
+    try:
+        value = await _check_whisper_health()
+        _HEALTH_CACHE["value"] = value
+        _HEALTH_CACHE["ts"] = time.monotonic()
+        return value
+    finally:
+        _HEALTH_CACHE["task"] = None
+
+@router.get("/whisper/health")
+async def whisper_health_check():
+    """
+    WhisperLiveKit 서버 헬스체크
+    - 컨테이너 상태 확인
+    - WebSocket 서버 응답 확인
+    - WHISPER_HEALTH_TTL_SEC 동안 결과 재사용, 동시 요청은 한 번의 확인으로 병합
+    """
+    if _HEALTH_CACHE["value"] is not None and time.monotonic() - _HEALTH_CACHE["ts"] < WHISPER_HEALTH_TTL_SEC:
+        return _HEALTH_CACHE["value"]
+    
+    task = _HEALTH_CACHE["task"]
+    if task is None:
+        task = asyncio.create_task(_refresh_whisper_health())
+        _HEALTH_CACHE["task"] = task
+    # 한 요청이 취소되어도 다른 대기 요청의 확인은 계속 진행
+    return await asyncio.shield(task)
+
 @router.post("/whisper/restart")
 async def restart_whisper():
     """
@@ -631,17 +886,16 @@ async def restart_whisper():
     - Docker 컨테이너 재시작
     """
     logger.info("[ADMIN] WhisperLiveKit 재시작 요청")
+    _HEALTH_CACHE["value"] = None
     
     try:
         # Docker 컨테이너 재시작
-        restart_cmd = subprocess.run(
-            ["docker", "restart", WHISPER_CONTAINER_NAME],
-            capture_output=True,
-            text=True,
-            timeout=30
+        response = await _docker_client().post(
+            f"/containers/{WHISPER_CONTAINER_NAME}/restart",
+            timeout=30.0
         )
         
-        if restart_cmd.returncode == 0:
+        if response.status_code == 204:
             logger.info("[ADMIN] WhisperLiveKit 재시작 완료")
             return {
                 "status": "success",
@@ -649,13 +903,47 @@ async def restart_whisper():
                 "container": WHISPER_CONTAINER_NAME
             }
         else:
-            logger.error(f"[ADMIN] 재시작 실패: {restart_cmd.stderr}")
+            error = response.text
+            logger.error("[ADMIN] 재시작 실패: %s", error)
             raise HTTPException(
                 status_code=500,
-                detail=f"재시작 실패: {restart_cmd.stderr}"
+                detail=f"재시작 실패: {error}"
             )
-    except subprocess.TimeoutExpired:
+    except httpx.TimeoutException:
         raise HTTPException(status_code=504, detail="재시작 타임아웃 (30초 초과)")
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"[ADMIN] 재시작 오류: {e}")
+        logger.error("[ADMIN] 재시작 오류: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
+
+
+# =============================================================================
+# [advice from AI] 동시 스트림 상한 관리 - 재시작 없이 조정
+# =============================================================================
+
+class StreamLimits(BaseModel):
+    """동시 스트림 상한 (0이면 제한 없음, 생략한 항목은 유지)"""
+    model_config = ConfigDict(extra='forbid')
+    live: Optional[int] = None
+    proxy: Optional[int] = None
+
+@router.get("/stream-limits")
+async def get_stream_limits():
+    """실시간 STT / 비디오 프록시 동시 스트림 상한 및 사용 현황"""
+    return {
+        "live": live_stream_limiter.stats(),
+        "proxy": proxy_stream_limiter.stats()
+    }
+
+@router.post("/stream-limits")
+async def set_stream_limits(limits: StreamLimits):
+    """동시 스트림 상한 변경 (대기 중인 요청은 늘어난 상한만큼 바로 진행)"""
+    for limiter, value in ((live_stream_limiter, limits.live), (proxy_stream_limiter, limits.proxy)):
+        if value is None:
+            continue
+        if value < 0:
+            raise HTTPException(status_code=400, detail="상한은 0 이상이어야 합니다")
+        await limiter.set_limit(value)
+        logger.info("[ADMIN] %s 동시 스트림 상한: %s", limiter.name, value)
+    return await get_stream_limits()
@@ -2,7 +2,6 @@
 
 import os
 import tempfile
-import aiofiles
 from fastapi import APIRouter, UploadFile, File, HTTPException, BackgroundTasks
 from fastapi.responses import PlainTextResponse, JSONResponse
 from pydantic import BaseModel
@@ -11,12 +10,12 @@ from typing import Optional, List
 from ..models.subtitle import SubtitleSegment, ProcessStatus
 from ..services.pipeline import process_video, PipelineResult
 from ..services.audio_extractor import audio_extractor
+from ..services.upload_storage import upload_path, save_upload
 
 router = APIRouter(prefix="/api/pipeline", tags=["pipeline"])
 
-# [advice from AI] 업로드 디렉토리
-UPLOAD_DIR = os.getenv("UPLOAD_DIR", "/tmp/ktv-uploads")
-os.makedirs(UPLOAD_DIR, exist_ok=True)
+# [advice from AI] 업로드 허용 영상 확장자
+ALLOWED_VIDEO_EXTENSIONS = frozenset({".mp4", ".webm", ".mov", ".avi", ".mkv", ".m4v"})
 
 
 class PipelineRequest(BaseModel):
@@ -52,24 +51,21 @@ async def process_video_file(
     """
     
     # [advice from AI] 파일 형식 검증
-    allowed_extensions = {".mp4", ".webm", ".mov", ".avi", ".mkv", ".m4v"}
     file_ext = os.path.splitext(file.filename)[1].lower()
     
-    if file_ext not in allowed_extensions:
+    if file_ext not in ALLOWED_VIDEO_EXTENSIONS:
         raise HTTPException(
             status_code=400,
-            detail=f"지원하지 않는 파일 형식입니다. 지원 형식: {', '.join(allowed_extensions)}"
+            detail=f"지원하지 않는 파일 형식입니다. 지원 형식: {', '.join(ALLOWED_VIDEO_EXTENSIONS)}"
         )
     
     # [advice from AI] 파일 저장
-    temp_file_path = os.path.join(UPLOAD_DIR, f"upload_{os.urandom(8).hex()}{file_ext}")
+    temp_file_path = upload_path("upload", file, file_ext)
     
     try:
-        async with aiofiles.open(temp_file_path, "wb") as f:
-            content = await file.read()
-            await f.write(content)
+        file_size = await save_upload(file, temp_file_path)
         
-        print(f"[Pipeline API] File saved: {temp_file_path} ({len(content)} bytes)")
+        print(f"[Pipeline API] File saved: {temp_file_path} ({file_size} bytes)")
         
         # [advice from AI] 파이프라인 실행
         result = await process_video(
@@ -192,8 +188,8 @@ async def get_media_info(file_path: str):
             detail=f"파일을 찾을 수 없습니다: {file_path}"
         )
     
-    info = audio_extractor.get_media_info(file_path)
-    duration = audio_extractor.get_duration(file_path)
+    info = await audio_extractor.get_media_info(file_path)
+    duration = await audio_extractor.get_duration(file_path)
     
     return {
         "file_path": file_path,
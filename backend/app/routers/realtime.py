@@ -1,14 +1,23 @@
 # [advice from AI] 초저지연 실시간 STT API - 2초 이내 문장 단위
 
 import os
+import re
+import glob
+import base64
+import binascii
+import urllib.parse
 import asyncio
-import aiofiles
+import logging
+import traceback
 from fastapi import APIRouter, UploadFile, File, HTTPException, WebSocket, WebSocketDisconnect, Query, Request
-from fastapi.responses import StreamingResponse, Response
+from fastapi.responses import StreamingResponse, Response, HTMLResponse
+from starlette.background import BackgroundTask
 import httpx
 from typing import Optional
-import json
 import time
+import orjson
+from collections import OrderedDict
+from functools import lru_cache
 
 from ..services.realtime_stt import (
     HAIVStreamingSTT,
@@ -31,6 +40,18 @@ from ..services.realtime_pipeline import (
     StreamEventType
 )
 from ..services.audio_extractor import audio_extractor
+# [advice from AI] 파일 전체 처리용 faster-whisper 배치 추론 (선택 의존성)
+from ..services.batched_whisper_client import batched_whisper
+from ..services.upload_storage import UPLOAD_DIR, upload_path, save_upload
+from ..services.stream_limiter import live_stream_limiter, proxy_stream_limiter
+
+# [advice from AI] yt-dlp 파이썬 API (미설치 시 CLI 사용)
+try:
+    from yt_dlp import YoutubeDL
+    from yt_dlp.utils import YoutubeDLError as YtDlpError
+except ImportError:
+    YoutubeDL = None
+    YtDlpError = RuntimeError
 
 # [advice from AI] STT 엔진 타입
 from enum import Enum
@@ -42,11 +63,39 @@ class STTEngine(str, Enum):
     HAIV_E2E = "haiv_e2e"      # 새 HAIV E2E (16K)
     HAIV_WHISPER = "haiv_whisper"  # 새 HAIV Whisper (16K)
 
+
+# [advice from AI] 엔진별 STT 스트림 생성 레지스트리 - 라우트마다 if/elif로 분기하지 않음
+# 클라이언트 객체는 스트림마다 상태(segment_id, 소켓 등)를 가지므로 요청마다 새로 생성
+STT_STREAM_FACTORIES = {
+    STTEngine.WHISPER: lambda: WhisperLiveKitSTT().process_audio_stream,   # WhisperLiveKit (로컬 Whisper 대체)
+    STTEngine.HAIV: lambda: HAIVStreamingSTT(preset="haiv").process_video,  # HAIV 기본 (8K)
+    STTEngine.HAIV_E2E: lambda: HAIVStreamingSTT(preset="haiv_e2e").process_video,
+    STTEngine.HAIV_WHISPER: lambda: HAIVStreamingSTT(preset="haiv_whisper").process_video,
+}
+
+
+def open_stt_stream(
+    stt_engine: STTEngine,
+    input_path: str,
+    enable_diarization: bool = True,
+    start_offset: float = 0.0,
+    sync_mode: bool = False
+):
+    """선택된 엔진으로 자막 스트림(async generator) 생성"""
+    process = STT_STREAM_FACTORIES[stt_engine]()
+    return process(
+        input_path=input_path,
+        enable_diarization=enable_diarization,
+        start_offset=start_offset,
+        sync_mode=sync_mode
+    )
+
 router = APIRouter(prefix="/api/realtime", tags=["realtime"])
 
-# [advice from AI] 업로드 디렉토리
-UPLOAD_DIR = os.getenv("UPLOAD_DIR", "/tmp/ktv-uploads")
-os.makedirs(UPLOAD_DIR, exist_ok=True)
+logger = logging.getLogger(__name__)
+
+# [advice from AI] 업로드 허용 영상 확장자 (요청마다 set을 새로 만들지 않도록 모듈 상수로)
+ALLOWED_VIDEO_EXTENSIONS = frozenset({".mp4", ".webm", ".mov", ".avi", ".mkv", ".m4v"})
 
 
 @router.post("/reset-whisper")
@@ -56,20 +105,24 @@ async def reset_whisper_stt():
     
     STT-Full-Service 컨테이너를 재시작하여 불안정한 상태를 초기화합니다.
     """
-    import subprocess
-    
     print("[ROUTER] 🔄 Whisper STT 초기화 요청")
     
     try:
-        # [advice from AI] Docker 명령어로 STT 컨테이너 재시작
-        result = subprocess.run(
-            ["docker", "restart", "stt-full-service"],
-            capture_output=True,
-            text=True,
-            timeout=30
+        # [advice from AI] Docker 명령어로 STT 컨테이너 재시작 (이벤트 루프를 막지 않도록 비동기 실행)
+        process = await asyncio.create_subprocess_exec(
+            "docker", "restart", "stt-full-service",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
         )
+        try:
+            async with asyncio.timeout(30):
+                _, stderr = await process.communicate()
+        except TimeoutError:
+            process.kill()
+            await process.wait()
+            raise
         
-        if result.returncode == 0:
+        if process.returncode == 0:
             print("[ROUTER] ✅ Whisper STT 재시작 성공!")
             # 모델 로드 대기 (10초)
             await asyncio.sleep(10)
@@ -78,13 +131,14 @@ async def reset_whisper_stt():
                 "message": "Whisper STT 서비스가 재시작되었습니다. 약 30초 후 사용 가능합니다."
             }
         else:
-            print(f"[ROUTER] ❌ 재시작 실패: {result.stderr}")
+            error = stderr.decode(errors="replace")
+            print(f"[ROUTER] ❌ 재시작 실패: {error}")
             return {
                 "success": False,
-                "message": f"재시작 실패: {result.stderr}"
+                "message": f"재시작 실패: {error}"
             }
     
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         print("[ROUTER] ❌ 재시작 타임아웃")
         return {
             "success": False,
@@ -98,21 +152,173 @@ async def reset_whisper_stt():
         }
 
 
-def subtitle_to_sse(subtitle: RealtimeSubtitle) -> str:
-    """자막을 SSE 형식으로 변환"""
-    data = {
-        "type": "subtitle",
-        "data": {
-            "id": subtitle.id,
-            "start_time": subtitle.start_time,
-            "end_time": subtitle.end_time,
-            "text": subtitle.text,
-            "speaker": subtitle.speaker,
-            "is_final": subtitle.is_final,
-            "timestamp": time.time()
-        }
+def sse_event(event_type: str, data: dict) -> bytes:
+    """SSE 이벤트를 바이트로 변환
+    
+    [advice from AI] orjson으로 한 번만 직렬화하고 바이트로 바로 yield
+    (StreamingResponse가 str을 다시 UTF-8로 인코딩하는 단계 생략)
+    """
+    return b"data: " + orjson.dumps({"type": event_type, "data": data}) + b"\n\n"
+
+
+async def probe_duration(path: str) -> float:
+    """미디어 길이(초) 조회 (ffprobe 결과는 AudioExtractor에서 캐시)"""
+    return await audio_extractor.get_duration(path)
+
+
+# [advice from AI] SSE 공통 헤더 + 첫 청크 패딩 (프록시가 버퍼를 채울 때까지 첫 자막을 붙잡지 않도록)
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no"
+}
+SSE_PADDING = b": " + b" " * 2048 + b"\n\n"
+
+
+async def _sse_with_padding(agen):
+    try:
+        yield SSE_PADDING
+        async for chunk in agen:
+            yield chunk
+    finally:
+        # 클라이언트 연결 종료 시에도 내부 제너레이터의 finally(임시 파일 정리)가 바로 실행되도록
+        await agen.aclose()
+
+
+def sse_response(agen) -> StreamingResponse:
+    """SSE 제너레이터를 StreamingResponse로 감싸기 (패딩 주석을 먼저 전송)"""
+    return StreamingResponse(
+        _sse_with_padding(agen),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS
+    )
+
+
+async def ws_send(websocket: WebSocket, payload: dict):
+    """WebSocket JSON 전송 (send_json 대신 orjson 직렬화, 텍스트 프레임 유지)"""
+    await websocket.send_text(orjson.dumps(payload).decode())
+
+
+# [advice from AI] 고정 구조 이벤트는 바이트 템플릿으로 생성 (dict 생성 + JSON 인코딩 생략)
+# 문자열 값은 enum 등 이스케이프가 필요 없는 값만 넣을 것
+SSE_ULTRA_INIT_TMPL = b'data: {"type":"init","data":{"duration":%.3f,"mode":"ultra_realtime","engine":"%s"}}\n\n'
+SSE_PROGRESS_TMPL = b'data: {"type":"progress","data":{"progress":%d,"count":%d}}\n\n'
+SSE_COMPLETE_TMPL = b'data: {"type":"complete","data":{"total_subtitles":%d,"processing_time":%.3f}}\n\n'
+SSE_SUBTITLE_PREFIX = b'data: {"type":"subtitle","data":'
+
+
+def subtitle_payload(subtitle: RealtimeSubtitle, timestamp: Optional[float] = None) -> dict:
+    """자막 SSE 데이터"""
+    return {
+        "id": subtitle.id,
+        "start_time": subtitle.start_time,
+        "end_time": subtitle.end_time,
+        "text": subtitle.text,
+        "speaker": subtitle.speaker,
+        "is_final": subtitle.is_final,
+        "timestamp": timestamp if timestamp is not None else time.time()
     }
-    return f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def subtitle_to_sse(subtitle: RealtimeSubtitle) -> bytes:
+    """자막을 SSE 형식으로 변환"""
+    return sse_event("subtitle", subtitle_payload(subtitle))
+
+
+def subtitles_to_sse(subtitles: list) -> bytes:
+    """자막 묶음을 SSE 형식으로 변환 (1개면 기존 subtitle 이벤트 그대로)"""
+    if len(subtitles) == 1:
+        return subtitle_to_sse(subtitles[0])
+    now = time.time()
+    return sse_event("subtitle_batch", [subtitle_payload(s, now) for s in subtitles])
+
+
+# [advice from AI] 짧은 시간 창에 몰린 자막을 한 SSE 프레임으로 묶어 전송 (쓰기/청크 인코딩 횟수 감소)
+SUBTITLE_BATCH_WINDOW_SEC = 0.1
+SUBTITLE_BATCH_MAX = 8
+SUBTITLE_LOG_EVERY = 10  # 자막 로그는 N개마다 한 번만 출력
+_STT_DONE = object()
+
+
+async def batch_subtitles(stt_generator):
+    """STT 자막 제너레이터를 SUBTITLE_BATCH_WINDOW_SEC 단위 리스트로 묶어서 전달
+    
+    제너레이터는 별도 태스크에서 큐로 옮겨 받으므로, 대기 중 취소되어도 STT 쪽은 영향 없음
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    
+    async def pump():
+        try:
+            async for subtitle in stt_generator:
+                queue.put_nowait(subtitle)
+        except Exception as e:
+            queue.put_nowait(e)
+        finally:
+            queue.put_nowait(_STT_DONE)
+    
+    task = asyncio.create_task(pump())
+    try:
+        while True:
+            item = await queue.get()
+            if item is _STT_DONE:
+                return
+            if isinstance(item, Exception):
+                raise item
+            
+            # 첫 자막 이후 짧게 기다렸다가 그동안 들어온 자막을 함께 전송
+            batch = [item]
+            await asyncio.sleep(SUBTITLE_BATCH_WINDOW_SEC)
+            pending = None
+            while len(batch) < SUBTITLE_BATCH_MAX and not queue.empty():
+                item = queue.get_nowait()
+                if item is _STT_DONE or isinstance(item, Exception):
+                    pending = item
+                    break
+                batch.append(item)
+            yield batch
+            
+            if pending is _STT_DONE:
+                return
+            if pending is not None:
+                raise pending
+    finally:
+        task.cancel()
+
+
+# [advice from AI] 느린 클라이언트가 STT를 막지 않도록 STT와 SSE 전송 사이에 둘 큐 크기
+LIVE_SUBTITLE_QUEUE_MAX = 64
+
+
+async def decouple_subtitles(stt_generator, maxsize: int = LIVE_SUBTITLE_QUEUE_MAX):
+    """STT 자막 제너레이터를 별도 태스크에서 소비하고 큐를 통해 전달
+    
+    큐가 가득 차면(클라이언트 전송 지연) 확정되지 않은 부분 자막은 버리고 STT는 계속 진행,
+    소비 측이 취소/종료되면 STT 태스크도 취소
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+    
+    async def pump():
+        try:
+            async for subtitle in stt_generator:
+                if queue.full() and not subtitle.is_final:
+                    continue
+                await queue.put(subtitle)
+        except Exception as e:
+            await queue.put(e)
+        finally:
+            await queue.put(_STT_DONE)
+    
+    task = asyncio.create_task(pump())
+    try:
+        while True:
+            item = await queue.get()
+            if item is _STT_DONE:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        task.cancel()
 
 
 @router.post("/ultra")
@@ -139,10 +345,9 @@ async def ultra_realtime_stream(
     print(f"[ROUTER] 📥 /api/realtime/ultra 요청 수신: {file.filename}, diarization={enable_diarization}, engine={stt_engine}")
     
     # [advice from AI] 파일 형식 검증
-    allowed_extensions = {".mp4", ".webm", ".mov", ".avi", ".mkv", ".m4v"}
     file_ext = os.path.splitext(file.filename)[1].lower()
     
-    if file_ext not in allowed_extensions:
+    if file_ext not in ALLOWED_VIDEO_EXTENSIONS:
         print(f"[ROUTER] ❌ 지원하지 않는 파일 형식: {file_ext}")
         raise HTTPException(
             status_code=400,
@@ -150,13 +355,11 @@ async def ultra_realtime_stream(
         )
     
     # [advice from AI] 파일 저장
-    temp_file_path = os.path.join(UPLOAD_DIR, f"ultra_{os.urandom(8).hex()}{file_ext}")
+    temp_file_path = upload_path("ultra", file, file_ext)
     
     print(f"[ROUTER] 📁 파일 저장 시작: {temp_file_path}")
-    async with aiofiles.open(temp_file_path, "wb") as f:
-        content = await file.read()
-        await f.write(content)
-    print(f"[ROUTER] ✅ 파일 저장 완료: {len(content)} bytes")
+    file_size = await save_upload(file, temp_file_path)
+    print(f"[ROUTER] ✅ 파일 저장 완료: {file_size} bytes")
     
     async def ultra_event_generator():
         """초저지연 SSE 이벤트 생성기"""
@@ -166,89 +369,52 @@ async def ultra_realtime_stream(
         try:
             # 초기화 이벤트
             print(f"[ROUTER] 🎬 영상 길이 확인 중...")
-            duration = audio_extractor.get_duration(temp_file_path)
+            duration = await probe_duration(temp_file_path)
             print(f"[ROUTER] 📊 영상 길이: {duration}초")
-            yield f"data: {json.dumps({'type': 'init', 'data': {'duration': duration, 'mode': 'ultra_realtime', 'engine': stt_engine.value}}, ensure_ascii=False)}\n\n"
+            yield SSE_ULTRA_INIT_TMPL % (duration, stt_engine.value.encode())
             
             # [advice from AI] 선택된 엔진으로 실시간 처리 시작
             print(f"[ROUTER] 🚀 {stt_engine.value.upper()} STT 시작! (offset: {start_offset}초, sync: {sync_mode})")
             
-            if stt_engine == STTEngine.WHISPER:
-                # [advice from AI] WhisperLiveKit 기반 STT (로컬 Whisper 대체)
-                stt = WhisperLiveKitSTT()
-                stt_generator = stt.process_audio_stream(
-                    input_path=temp_file_path,
-                    enable_diarization=enable_diarization,
-                    start_offset=start_offset,
-                    sync_mode=sync_mode
-                )
-            elif stt_engine == STTEngine.HAIV_E2E:
-                # [advice from AI] 새 HAIV E2E (16K) 실시간
-                from ..services.realtime_stt import HAIVStreamingSTT
-                stt = HAIVStreamingSTT(preset="haiv_e2e")
-                stt_generator = stt.process_video(
-                    input_path=temp_file_path,
-                    enable_diarization=enable_diarization,
-                    start_offset=start_offset,
-                    sync_mode=sync_mode
-                )
-            elif stt_engine == STTEngine.HAIV_WHISPER:
-                # [advice from AI] 새 HAIV Whisper (16K) 실시간
-                from ..services.realtime_stt import HAIVStreamingSTT
-                stt = HAIVStreamingSTT(preset="haiv_whisper")
-                stt_generator = stt.process_video(
-                    input_path=temp_file_path,
-                    enable_diarization=enable_diarization,
-                    start_offset=start_offset,
-                    sync_mode=sync_mode
-                )
-            else:
-                # HAIV 기반 STT (기본 - 8K)
-                stt_generator = process_video_realtime(
-                    input_path=temp_file_path,
-                    enable_diarization=enable_diarization,
-                    start_offset=start_offset,
-                    sync_mode=sync_mode
-                )
+            stt_generator = open_stt_stream(
+                stt_engine,
+                input_path=temp_file_path,
+                enable_diarization=enable_diarization,
+                start_offset=start_offset,
+                sync_mode=sync_mode
+            )
             
-            async for subtitle in stt_generator:
-                subtitle_count += 1
-                elapsed = time.time() - start_time
+            async for batch in batch_subtitles(stt_generator):
+                prev_count = subtitle_count
+                subtitle_count += len(batch)
+                subtitle = batch[-1]
                 
-                print(f"[ROUTER] 🎤 자막 #{subtitle_count}: [{subtitle.start_time:.1f}s] {subtitle.text[:30]}...")
+                if prev_count // SUBTITLE_LOG_EVERY != subtitle_count // SUBTITLE_LOG_EVERY:
+                    print(f"[ROUTER] 🎤 자막 #{subtitle_count}: [{subtitle.start_time:.1f}s] {subtitle.text[:30]}...")
                 
-                # 자막 이벤트 즉시 전송
-                yield subtitle_to_sse(subtitle)
+                # 자막 이벤트 전송 (짧은 시간 창 단위로 묶음)
+                yield subtitles_to_sse(batch)
                 
                 # 진행률 이벤트 (10개마다)
-                if subtitle_count % 10 == 0:
+                if prev_count // 10 != subtitle_count // 10:
                     progress = min(99, int((subtitle.end_time / duration) * 100)) if duration > 0 else 0
-                    yield f"data: {json.dumps({'type': 'progress', 'data': {'progress': progress, 'count': subtitle_count}}, ensure_ascii=False)}\n\n"
+                    yield SSE_PROGRESS_TMPL % (progress, subtitle_count)
             
             # 완료 이벤트
             total_time = time.time() - start_time
             print(f"[ROUTER] ✅ 처리 완료: {subtitle_count}개 자막, {total_time:.1f}초 소요")
-            yield f"data: {json.dumps({'type': 'complete', 'data': {'total_subtitles': subtitle_count, 'processing_time': total_time}}, ensure_ascii=False)}\n\n"
+            yield SSE_COMPLETE_TMPL % (subtitle_count, total_time)
             
         except Exception as e:
             print(f"[ROUTER] ❌ 오류 발생: {e}")
-            import traceback
             traceback.print_exc()
-            yield f"data: {json.dumps({'type': 'error', 'data': {'message': str(e)}}, ensure_ascii=False)}\n\n"
+            yield sse_event('error', {'message': str(e)})
         finally:
             if os.path.exists(temp_file_path):
                 os.remove(temp_file_path)
                 print(f"[ROUTER] 🗑️ 임시 파일 삭제")
     
-    return StreamingResponse(
-        ultra_event_generator(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no"
-        }
-    )
+    return sse_response(ultra_event_generator())
 
 
 # [advice from AI] 파일 전체 처리 후 자막 반환 (타임스탬프 매칭 방식)
@@ -267,80 +433,201 @@ async def process_file_complete(
     3. 타임스탬프가 포함된 자막 목록 반환
     4. 프론트엔드에서 영상 currentTime에 맞춰 표시
     """
-    import time as time_module
     
     print(f"[ROUTER] 📥 /process 요청: {file.filename}, engine={stt_engine}")
     
     # 파일 형식 검증
-    allowed_extensions = {".mp4", ".webm", ".mov", ".avi", ".mkv", ".m4v"}
     file_ext = os.path.splitext(file.filename)[1].lower()
     
-    if file_ext not in allowed_extensions:
+    if file_ext not in ALLOWED_VIDEO_EXTENSIONS:
         raise HTTPException(status_code=400, detail="지원하지 않는 파일 형식입니다")
     
     # 파일 저장
-    temp_file_path = os.path.join(UPLOAD_DIR, f"process_{os.urandom(8).hex()}{file_ext}")
+    temp_file_path = upload_path("process", file, file_ext)
     
-    async with aiofiles.open(temp_file_path, "wb") as f:
-        content = await file.read()
-        await f.write(content)
+    file_size = await save_upload(file, temp_file_path)
     
-    print(f"[ROUTER] ✅ 파일 저장: {len(content)} bytes")
+    print(f"[ROUTER] ✅ 파일 저장: {file_size} bytes")
     
     try:
         # 영상 길이 확인
-        duration = audio_extractor.get_duration(temp_file_path)
+        duration = await probe_duration(temp_file_path)
         print(f"[ROUTER] 📊 영상 길이: {duration}초")
         
         # STT 전체 처리 (sync_mode=False로 최대 속도)
-        subtitles = []
-        start_time = time_module.time()
-        
-        if stt_engine == STTEngine.WHISPER:
-            # [advice from AI] WhisperLiveKit 기반 STT
-            stt = WhisperLiveKitSTT()
-            stt_generator = stt.process_audio_stream(
-                input_path=temp_file_path,
-                enable_diarization=enable_diarization,
-                start_offset=0,
-                sync_mode=False  # 최대 속도로 처리
-            )
+        if stt_engine == STTEngine.WHISPER and batched_whisper.is_available():
+            # [advice from AI] 실시간 동기화가 필요 없으므로 faster-whisper 배치 추론 사용
+            stt_generator = batched_whisper.process_file(temp_file_path)
         else:
-            stt_generator = process_video_realtime(
+            stt_generator = open_stt_stream(
+                stt_engine,
                 input_path=temp_file_path,
                 enable_diarization=enable_diarization,
                 start_offset=0,
                 sync_mode=False  # 최대 속도로 처리
             )
-        
-        async for subtitle in stt_generator:
-            subtitles.append({
-                "id": subtitle.id,
-                "start_time": subtitle.start_time,
-                "end_time": subtitle.end_time,
-                "text": subtitle.text,
-                "speaker": subtitle.speaker
-            })
-        
-        processing_time = time_module.time() - start_time
-        print(f"[ROUTER] ✅ 처리 완료: {len(subtitles)}개 자막, {processing_time:.1f}초 소요")
-        
-        return {
-            "success": True,
-            "duration": duration,
-            "processing_time": processing_time,
-            "total_subtitles": len(subtitles),
-            "subtitles": subtitles
-        }
-        
     except Exception as e:
         print(f"[ROUTER] ❌ 오류: {e}")
-        import traceback
         traceback.print_exc()
-        raise HTTPException(status_code=500, detail=str(e))
-    finally:
         if os.path.exists(temp_file_path):
             os.remove(temp_file_path)
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    # [advice from AI] 자막 목록을 메모리에 모으지 않고 JSON 배열로 바로 스트리밍
+    # 처리 시간/자막 수는 끝난 뒤에 알 수 있으므로 뒤쪽 필드로 전송
+    async def emit_json():
+        start_time = time.time()
+        count = 0
+        try:
+            yield b'{"duration":' + orjson.dumps(duration) + b',"subtitles":['
+            try:
+                async for subtitle in stt_generator:
+                    item = orjson.dumps({
+                        "id": subtitle.id,
+                        "start_time": subtitle.start_time,
+                        "end_time": subtitle.end_time,
+                        "text": subtitle.text,
+                        "speaker": subtitle.speaker
+                    })
+                    yield item if count == 0 else b"," + item
+                    count += 1
+            except Exception as e:
+                # 응답 헤더는 이미 나갔으므로 500 대신 success=false로 마무리
+                print(f"[ROUTER] ❌ 오류: {e}")
+                traceback.print_exc()
+                yield b'],"total_subtitles":' + orjson.dumps(count) + b',"success":false,"error":' + orjson.dumps(str(e)) + b'}'
+                return
+            
+            processing_time = time.time() - start_time
+            print(f"[ROUTER] ✅ 처리 완료: {count}개 자막, {processing_time:.1f}초 소요")
+            yield (
+                b'],"processing_time":' + orjson.dumps(processing_time)
+                + b',"total_subtitles":' + orjson.dumps(count)
+                + b',"success":true}'
+            )
+        finally:
+            if os.path.exists(temp_file_path):
+                os.remove(temp_file_path)
+    
+    return StreamingResponse(emit_json(), media_type="application/json")
+
+
+# [advice from AI] YouTube URL 패턴 (라이브 URL 포함) - 모듈 로드 시 한 번만 컴파일
+YOUTUBE_URL_RE = re.compile(r'(https?://)?(www\.)?(youtube\.com/watch\?v=|youtu\.be/|youtube\.com/live/)[\w-]+')
+
+# [advice from AI] yt-dlp 1회 호출로 길이/제목/재생 URL을 함께 추출 - 이벤트 루프를 막지 않도록 비동기 실행
+# 기본은 프로세스 내 yt_dlp API (CLI 기동 + 임포트 비용 ~0.5초 생략), YTDLP_IN_PROCESS=0이면 CLI 사용
+YTDLP_TIMEOUT_SEC = 30
+YTDLP_FORMAT = "best[ext=mp4]/best"
+YTDLP_IN_PROCESS = os.getenv("YTDLP_IN_PROCESS", "1") != "0" and YoutubeDL is not None
+YTDLP_OPTS = {
+    "quiet": True,
+    "no_warnings": True,
+    "skip_download": True,
+    "noplaylist": True,
+    "format": YTDLP_FORMAT,
+    "socket_timeout": 15,
+}
+YTDLP_INFO_TTL_SEC = 300  # 재생 URL 서명은 한동안 유효하므로 5분간 재사용
+YTDLP_LIVE_INFO_TTL_SEC = 60  # 라이브 재생 URL은 빨리 만료됨
+YTDLP_INFO_CACHE_MAX = 64
+_ytdlp_info_cache: "OrderedDict[str, tuple[float, dict]]" = OrderedDict()
+_ytdlp_inflight: "dict[str, asyncio.Task]" = {}  # 같은 URL 동시 요청은 추출 1회로 합침
+
+
+def _ytdlp_extract_sync(url: str) -> dict:
+    """yt_dlp API로 영상 정보 추출 (워커 스레드에서 실행, 인스턴스는 스레드 안전하지 않아 호출마다 생성)"""
+    with YoutubeDL(YTDLP_OPTS) as ydl:
+        return ydl.sanitize_info(ydl.extract_info(url, download=False))
+
+
+async def _ytdlp_extract_subprocess(url: str, timeout: float) -> dict:
+    """yt-dlp CLI(-J)로 영상 정보 추출"""
+    process = await asyncio.create_subprocess_exec(
+        "yt-dlp", "-J", "--no-playlist", "-f", YTDLP_FORMAT, "-q", url,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        async with asyncio.timeout(timeout):
+            stdout, stderr = await process.communicate()
+    except TimeoutError:
+        process.kill()
+        await process.wait()
+        raise
+    
+    if process.returncode != 0:
+        raise RuntimeError(f"YouTube 정보 추출 실패: {stderr.decode(errors='replace')}")
+    return orjson.loads(stdout)
+
+
+async def extract_youtube_info(url: str, timeout: float = YTDLP_TIMEOUT_SEC) -> dict:
+    """yt-dlp 원본 정보(dict) 추출"""
+    if not YTDLP_IN_PROCESS:
+        return await _ytdlp_extract_subprocess(url, timeout)
+    try:
+        async with asyncio.timeout(timeout):
+            return await asyncio.to_thread(_ytdlp_extract_sync, url)
+    except YtDlpError as e:
+        raise RuntimeError(f"YouTube 정보 추출 실패: {e}") from e
+
+
+async def _extract_and_cache(url: str, timeout: float) -> dict:
+    try:
+        info = await extract_youtube_info(url, timeout)
+        _ytdlp_info_cache[url] = (time.monotonic(), info)
+        _ytdlp_info_cache.move_to_end(url)
+        while len(_ytdlp_info_cache) > YTDLP_INFO_CACHE_MAX:
+            _ytdlp_info_cache.popitem(last=False)
+        return info
+    finally:
+        _ytdlp_inflight.pop(url, None)
+
+
+async def extract_youtube_info_cached(url: str, timeout: float = YTDLP_TIMEOUT_SEC) -> dict:
+    """extract_youtube_info + URL별 TTL/LRU 캐시 (detect → live 연속 호출 시 재추출 생략)"""
+    cached = _ytdlp_info_cache.get(url)
+    if cached is not None:
+        ttl = YTDLP_LIVE_INFO_TTL_SEC if cached[1].get("is_live") else YTDLP_INFO_TTL_SEC
+        if time.monotonic() - cached[0] < ttl:
+            _ytdlp_info_cache.move_to_end(url)
+            return cached[1]
+    
+    # [advice from AI] 진행 중인 추출이 있으면 그 결과를 함께 기다림 (한 요청이 끊겨도 추출은 계속)
+    task = _ytdlp_inflight.get(url)
+    if task is None:
+        task = asyncio.create_task(_extract_and_cache(url, timeout))
+        # 기다리던 요청이 모두 타임아웃돼도 "exception was never retrieved" 경고가 남지 않도록
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        _ytdlp_inflight[url] = task
+    async with asyncio.timeout(timeout):
+        return await asyncio.shield(task)
+
+
+def youtube_stream_url(info: dict) -> Optional[str]:
+    """선택된 포맷의 재생 URL"""
+    if info.get("url"):
+        return info["url"]
+    formats = info.get("requested_formats") or []
+    return formats[0].get("url") if formats else None
+
+
+def _youtube_summary(info: dict) -> dict:
+    return {
+        "duration": float(info.get("duration") or 0),
+        "title": info.get("title") or "Unknown",
+        "video_url": youtube_stream_url(info),
+    }
+
+
+async def fetch_youtube_info(youtube_url: str) -> dict:
+    """yt-dlp 결과에서 duration/title/video_url 추출"""
+    return _youtube_summary(await extract_youtube_info(youtube_url))
+
+
+async def fetch_youtube_info_cached(youtube_url: str) -> dict:
+    """fetch_youtube_info + URL별 TTL/LRU 캐시"""
+    return _youtube_summary(await extract_youtube_info_cached(youtube_url))
 
 
 # [advice from AI] YouTube 영상 정보만 빠르게 추출 (라이브 STT용)
@@ -354,36 +641,22 @@ async def youtube_video_info(youtube_url: str):
     오디오 다운로드 없이 영상 정보 + 스트리밍 URL만 빠르게 반환
     프론트엔드에서 Web Audio API로 라이브 STT 처리
     """
-    import subprocess
-    import re
-    
     print(f"[ROUTER] 📺 YouTube 정보 요청: {youtube_url}")
     
     # YouTube URL 유효성 검사 (라이브 URL 포함)
-    youtube_pattern = r'(https?://)?(www\.)?(youtube\.com/watch\?v=|youtu\.be/|youtube\.com/live/)[\w-]+'
-    if not re.match(youtube_pattern, youtube_url):
+    if not YOUTUBE_URL_RE.match(youtube_url):
         raise HTTPException(status_code=400, detail="유효하지 않은 YouTube URL입니다")
     
     try:
-        # 영상 정보 가져오기
+        # 영상 정보 + 재생 URL 가져오기
         print(f"[ROUTER] 🔍 YouTube 정보 추출 중...")
-        info_cmd = ["yt-dlp", "--print", "duration", "--print", "title", "-q", youtube_url]
-        info_result = subprocess.run(info_cmd, capture_output=True, text=True, timeout=30)
-        
-        if info_result.returncode != 0:
-            raise HTTPException(status_code=500, detail=f"YouTube 정보 추출 실패: {info_result.stderr}")
-        
-        lines = info_result.stdout.strip().split('\n')
-        duration = float(lines[0]) if lines[0] else 0
-        title = lines[1] if len(lines) > 1 else "Unknown"
+        info = await fetch_youtube_info_cached(youtube_url)
+        duration = info["duration"]
+        title = info["title"]
+        video_stream_url = info["video_url"]
         
         print(f"[ROUTER] 📊 영상: {title[:50]}..., 길이: {duration}초")
         
-        # 영상 URL 추출 (프론트엔드 재생용)
-        video_url_cmd = ["yt-dlp", "-f", "best[ext=mp4]/best", "-g", youtube_url]
-        video_url_result = subprocess.run(video_url_cmd, capture_output=True, text=True, timeout=30)
-        video_stream_url = video_url_result.stdout.strip() if video_url_result.returncode == 0 else None
-        
         print(f"[ROUTER] ✅ YouTube 정보 추출 완료!")
         
         return {
@@ -394,13 +667,14 @@ async def youtube_video_info(youtube_url: str):
             "mode": "youtube_live"  # 라이브 STT 모드 표시
         }
         
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         raise HTTPException(status_code=504, detail="YouTube 정보 추출 시간 초과")
     except HTTPException:
         raise
+    except RuntimeError as e:
+        raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
         print(f"[ROUTER] ❌ YouTube 오류: {e}")
-        import traceback
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -422,14 +696,11 @@ async def youtube_realtime_stream(
     ⚠️ 주의: 긴 영상은 다운로드에 시간이 오래 걸립니다.
     라이브 STT를 사용하려면 /youtube/info 엔드포인트를 사용하세요.
     """
-    import subprocess
-    import re
     
     print(f"[ROUTER] 📺 YouTube 요청 (레거시): {youtube_url}")
     
     # YouTube URL 유효성 검사
-    youtube_pattern = r'(https?://)?(www\.)?(youtube\.com/watch\?v=|youtu\.be/|youtube\.com/live/)[\w-]+'
-    if not re.match(youtube_pattern, youtube_url):
+    if not YOUTUBE_URL_RE.match(youtube_url):
         raise HTTPException(status_code=400, detail="유효하지 않은 YouTube URL입니다")
     
     async def youtube_event_generator():
@@ -441,35 +712,22 @@ async def youtube_realtime_stream(
             # [advice from AI] yt-dlp로 영상 정보 및 오디오 URL 추출
             print(f"[ROUTER] 🔍 YouTube 정보 추출 중...")
             
-            # 영상 정보 가져오기
-            info_cmd = ["yt-dlp", "--print", "duration", "--print", "title", "-q", youtube_url]
-            info_result = subprocess.run(info_cmd, capture_output=True, text=True, timeout=30)
-            
-            if info_result.returncode != 0:
-                raise Exception(f"YouTube 정보 추출 실패: {info_result.stderr}")
-            
-            lines = info_result.stdout.strip().split('\n')
-            duration = float(lines[0]) if lines[0] else 0
-            title = lines[1] if len(lines) > 1 else "Unknown"
+            # 영상 정보 + 재생 URL 가져오기
+            info = await fetch_youtube_info(youtube_url)
+            duration = info["duration"]
+            title = info["title"]
+            video_stream_url = info["video_url"]
             
             print(f"[ROUTER] 📊 영상: {title[:50]}..., 길이: {duration}초")
             
-            # 영상 URL 추출 (프론트엔드 재생용)
-            video_url_cmd = ["yt-dlp", "-f", "best[ext=mp4]/best", "-g", youtube_url]
-            video_url_result = subprocess.run(video_url_cmd, capture_output=True, text=True, timeout=30)
-            video_stream_url = video_url_result.stdout.strip() if video_url_result.returncode == 0 else None
-            
             # 초기화 이벤트 (영상 URL 포함)
             init_data = {
-                'type': 'init',
-                'data': {
-                    'duration': duration,
-                    'title': title,
-                    'mode': 'youtube',
-                    'video_url': video_stream_url
-                }
+                'duration': duration,
+                'title': title,
+                'mode': 'youtube',
+                'video_url': video_stream_url
             }
-            yield f"data: {json.dumps(init_data, ensure_ascii=False)}\n\n"
+            yield sse_event('init', init_data)
             
             # [advice from AI] yt-dlp로 오디오 다운로드 (스트리밍용 WAV)
             print(f"[ROUTER] 🎵 오디오 추출 시작...")
@@ -484,16 +742,27 @@ async def youtube_realtime_stream(
                 youtube_url
             ]
             
-            dl_result = subprocess.run(download_cmd, capture_output=True, text=True, timeout=300)
+            # [advice from AI] 다운로드가 이벤트 루프를 막지 않도록 비동기 실행 (타임아웃 시 프로세스 종료)
+            process = await asyncio.create_subprocess_exec(
+                *download_cmd,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE
+            )
+            try:
+                async with asyncio.timeout(300):
+                    _, stderr = await process.communicate()
+            except TimeoutError:
+                process.kill()
+                await process.wait()
+                raise
             
-            if dl_result.returncode != 0:
-                raise Exception(f"오디오 추출 실패: {dl_result.stderr}")
+            if process.returncode != 0:
+                raise Exception(f"오디오 추출 실패: {stderr.decode(errors='replace')}")
             
             # 실제 파일 경로 확인 (yt-dlp가 확장자를 변경할 수 있음)
             actual_audio_path = temp_audio_path
             if not os.path.exists(actual_audio_path):
                 # .wav 대신 다른 확장자로 저장되었을 수 있음
-                import glob
                 matches = glob.glob(temp_audio_path.replace('.wav', '.*'))
                 if matches:
                     actual_audio_path = matches[0]
@@ -505,63 +774,48 @@ async def youtube_realtime_stream(
             # [advice from AI] 선택된 엔진으로 실시간 STT 처리
             print(f"[ROUTER] 🚀 {stt_engine.value.upper()} STT 처리 시작!")
             
-            if stt_engine == STTEngine.WHISPER:
-                # [advice from AI] WhisperLiveKit 기반 STT
-                stt = WhisperLiveKitSTT()
-                stt_generator = stt.process_audio_stream(
-                    input_path=actual_audio_path,
-                    enable_diarization=enable_diarization
-                )
-            else:
-                stt_generator = process_video_realtime(
-                    input_path=actual_audio_path,
-                    enable_diarization=enable_diarization
-                )
+            stt_generator = open_stt_stream(
+                stt_engine,
+                input_path=actual_audio_path,
+                enable_diarization=enable_diarization
+            )
             
-            async for subtitle in stt_generator:
-                subtitle_count += 1
-                elapsed = time.time() - start_time
+            async for batch in batch_subtitles(stt_generator):
+                prev_count = subtitle_count
+                subtitle_count += len(batch)
+                subtitle = batch[-1]
                 
-                print(f"[ROUTER] 🎤 자막 #{subtitle_count}: [{subtitle.start_time:.1f}s] {subtitle.text[:30]}...")
+                if prev_count // SUBTITLE_LOG_EVERY != subtitle_count // SUBTITLE_LOG_EVERY:
+                    print(f"[ROUTER] 🎤 자막 #{subtitle_count}: [{subtitle.start_time:.1f}s] {subtitle.text[:30]}...")
                 
-                # 자막 이벤트 즉시 전송
-                yield subtitle_to_sse(subtitle)
+                # 자막 이벤트 전송 (짧은 시간 창 단위로 묶음)
+                yield subtitles_to_sse(batch)
                 
                 # 진행률 이벤트 (10개마다)
-                if subtitle_count % 10 == 0:
+                if prev_count // 10 != subtitle_count // 10:
                     progress = min(99, int((subtitle.end_time / duration) * 100)) if duration > 0 else 0
-                    yield f"data: {json.dumps({'type': 'progress', 'data': {'progress': progress, 'count': subtitle_count}}, ensure_ascii=False)}\n\n"
+                    yield SSE_PROGRESS_TMPL % (progress, subtitle_count)
             
             # 완료 이벤트
             total_time = time.time() - start_time
             print(f"[ROUTER] ✅ YouTube 처리 완료: {subtitle_count}개 자막, {total_time:.1f}초 소요")
-            yield f"data: {json.dumps({'type': 'complete', 'data': {'total_subtitles': subtitle_count, 'processing_time': total_time}}, ensure_ascii=False)}\n\n"
+            yield SSE_COMPLETE_TMPL % (subtitle_count, total_time)
             
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             print(f"[ROUTER] ⏰ YouTube 처리 타임아웃")
-            yield f"data: {json.dumps({'type': 'error', 'data': {'message': 'YouTube 처리 시간 초과'}}, ensure_ascii=False)}\n\n"
+            yield sse_event('error', {'message': 'YouTube 처리 시간 초과'})
         except Exception as e:
             print(f"[ROUTER] ❌ YouTube 오류: {e}")
-            import traceback
             traceback.print_exc()
-            yield f"data: {json.dumps({'type': 'error', 'data': {'message': str(e)}}, ensure_ascii=False)}\n\n"
+            yield sse_event('error', {'message': str(e)})
         finally:
             # 임시 파일 정리
-            import glob
             for f in glob.glob(temp_audio_path.replace('.wav', '.*')):
                 if os.path.exists(f):
                     os.remove(f)
                     print(f"[ROUTER] 🗑️ 임시 파일 삭제: {f}")
     
-    return StreamingResponse(
-        youtube_event_generator(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no"
-        }
-    )
+    return sse_response(youtube_event_generator())
 
 
 @router.get("/ultra-local")
@@ -584,8 +838,8 @@ async def ultra_realtime_local(
         subtitle_count = 0
         
         try:
-            duration = audio_extractor.get_duration(file_path)
-            yield f"data: {json.dumps({'type': 'init', 'data': {'duration': duration, 'mode': 'ultra_realtime'}}, ensure_ascii=False)}\n\n"
+            duration = await probe_duration(file_path)
+            yield sse_event('init', {'duration': duration, 'mode': 'ultra_realtime'})
             
             async for subtitle in process_video_realtime(
                 input_path=file_path,
@@ -595,20 +849,12 @@ async def ultra_realtime_local(
                 yield subtitle_to_sse(subtitle)
             
             total_time = time.time() - start_time
-            yield f"data: {json.dumps({'type': 'complete', 'data': {'total_subtitles': subtitle_count, 'processing_time': total_time}}, ensure_ascii=False)}\n\n"
+            yield SSE_COMPLETE_TMPL % (subtitle_count, total_time)
             
         except Exception as e:
-            yield f"data: {json.dumps({'type': 'error', 'data': {'message': str(e)}}, ensure_ascii=False)}\n\n"
+            yield sse_event('error', {'message': str(e)})
     
-    return StreamingResponse(
-        ultra_event_generator(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no"
-        }
-    )
+    return sse_response(ultra_event_generator())
 
 
 @router.websocket("/ws-ultra")
@@ -628,14 +874,14 @@ async def websocket_ultra_realtime(websocket: WebSocket):
     try:
         while True:
             data = await websocket.receive_text()
-            message = json.loads(data)
+            message = orjson.loads(data)
             action = message.get("action")
             
             if action == "start":
                 file_path = message.get("file_path")
                 
                 if not file_path or not os.path.exists(file_path):
-                    await websocket.send_json({
+                    await ws_send(websocket, {
                         "type": "error",
                         "data": {"message": "파일을 찾을 수 없습니다"}
                     })
@@ -644,8 +890,8 @@ async def websocket_ultra_realtime(websocket: WebSocket):
                 enable_diarization = message.get("enable_diarization", True)
                 
                 # 초기화
-                duration = audio_extractor.get_duration(file_path)
-                await websocket.send_json({
+                duration = await probe_duration(file_path)
+                await ws_send(websocket, {
                     "type": "init",
                     "data": {"duration": duration, "mode": "ultra_realtime"}
                 })
@@ -661,7 +907,7 @@ async def websocket_ultra_realtime(websocket: WebSocket):
                     subtitle_count += 1
                     
                     # 즉시 전송
-                    await websocket.send_json({
+                    await ws_send(websocket, {
                         "type": "subtitle",
                         "data": {
                             "id": subtitle.id,
@@ -675,7 +921,7 @@ async def websocket_ultra_realtime(websocket: WebSocket):
                     })
                 
                 # 완료
-                await websocket.send_json({
+                await ws_send(websocket, {
                     "type": "complete",
                     "data": {
                         "total_subtitles": subtitle_count,
@@ -684,12 +930,12 @@ async def websocket_ultra_realtime(websocket: WebSocket):
                 })
             
             elif action == "ping":
-                await websocket.send_json({"type": "pong"})
+                await ws_send(websocket, {"type": "pong"})
                 
     except WebSocketDisconnect:
         pass
     except Exception as e:
-        await websocket.send_json({
+        await ws_send(websocket, {
             "type": "error",
             "data": {"message": str(e)}
         })
@@ -708,17 +954,14 @@ async def stream_video_sse(
     초저지연이 필요하면 /api/realtime/ultra 사용 권장
     """
     
-    allowed_extensions = {".mp4", ".webm", ".mov", ".avi", ".mkv", ".m4v"}
     file_ext = os.path.splitext(file.filename)[1].lower()
     
-    if file_ext not in allowed_extensions:
+    if file_ext not in ALLOWED_VIDEO_EXTENSIONS:
         raise HTTPException(status_code=400, detail="지원하지 않는 파일 형식입니다.")
     
-    temp_file_path = os.path.join(UPLOAD_DIR, f"stream_{os.urandom(8).hex()}{file_ext}")
+    temp_file_path = upload_path("stream", file, file_ext)
     
-    async with aiofiles.open(temp_file_path, "wb") as f:
-        content = await file.read()
-        await f.write(content)
+    await save_upload(file, temp_file_path)
     
     async def event_generator():
         try:
@@ -734,11 +977,7 @@ async def stream_video_sse(
             if os.path.exists(temp_file_path):
                 os.remove(temp_file_path)
     
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream",
-        headers={"Cache-Control": "no-cache", "Connection": "keep-alive"}
-    )
+    return sse_response(event_generator())
 
 
 @router.get("/stream-local")
@@ -762,11 +1001,7 @@ async def stream_local_file_sse(
             if event.type in [StreamEventType.COMPLETE, StreamEventType.ERROR]:
                 break
     
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream",
-        headers={"Cache-Control": "no-cache", "Connection": "keep-alive"}
-    )
+    return sse_response(event_generator())
 
 
 # ============================================================================
@@ -803,7 +1038,6 @@ async def live_stt_websocket(
         await service.process_live_stream(websocket)
     except Exception as e:
         print(f"[WS-LIVE] ❌ 오류: {e}")
-        import traceback
         traceback.print_exc()
     finally:
         print(f"[WS-LIVE] 🔌 클라이언트 연결 종료")
@@ -812,9 +1046,6 @@ async def live_stt_websocket(
 # ============================================================================
 # [advice from AI] 실시간 스트리밍 URL STT (YouTube Live, HLS, RTMP 등)
 # ============================================================================
-import re
-import subprocess
-from enum import Enum
 
 class StreamType(str, Enum):
     """스트리밍 URL 타입"""
@@ -826,38 +1057,53 @@ class StreamType(str, Enum):
     UNKNOWN = "unknown"
 
 
+# [advice from AI] 타입 분류 집합은 모듈 상수로 (요청마다 리스트를 새로 만들지 않음)
+_YOUTUBE_TYPES = frozenset({StreamType.YOUTUBE_LIVE, StreamType.YOUTUBE_VIDEO})
+_BUFFERED_TYPES = frozenset({StreamType.YOUTUBE_LIVE, StreamType.HLS, StreamType.RTMP})
+
+
+# [advice from AI] 스트림 타입 판별용 패턴 - 모듈 로드 시 한 번만 컴파일
+# 판별 우선순위(YouTube → HLS → RTMP → 직접 영상 → HTTP)는 검사 순서로 유지
+# [advice from AI] 대소문자 무시 패턴으로 url.lower() 사본 생성 생략
+_YOUTUBE_HOST_RE = re.compile(r'youtube\.com|youtu\.be', re.IGNORECASE)
+_YOUTUBE_LIVE_RE = re.compile(r'live', re.IGNORECASE)
+_HLS_RE = re.compile(r'm3u8', re.IGNORECASE)
+_RTMP_RE = re.compile(r'rtmps?://', re.IGNORECASE)
+_DIRECT_EXT_RE = re.compile(r'\.(mp4|webm|mkv|avi|mov|flv)$', re.IGNORECASE)
+_HTTP_RE = re.compile(r'https?://', re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
 def detect_stream_type(url: str) -> tuple[StreamType, str]:
     """
-    URL을 분석하여 스트리밍 타입 감지
+    URL을 분석하여 스트리밍 타입 감지 (detect → live 순으로 같은 URL이 반복되므로 캐시)
     
     Returns:
         (StreamType, 설명 문자열)
     """
-    url_lower = url.lower().strip()
+    url = url.strip()
     
     # YouTube
-    if "youtube.com" in url_lower or "youtu.be" in url_lower:
-        if "/live/" in url_lower or "live" in url_lower:
+    if _YOUTUBE_HOST_RE.search(url):
+        if _YOUTUBE_LIVE_RE.search(url):
             return StreamType.YOUTUBE_LIVE, "YouTube 라이브 스트리밍"
-        else:
-            return StreamType.YOUTUBE_VIDEO, "YouTube 영상"
+        return StreamType.YOUTUBE_VIDEO, "YouTube 영상"
     
     # HLS (m3u8)
-    if url_lower.endswith(".m3u8") or "m3u8" in url_lower:
+    if _HLS_RE.search(url):
         return StreamType.HLS, "HLS 스트리밍 (m3u8)"
     
     # RTMP
-    if url_lower.startswith("rtmp://") or url_lower.startswith("rtmps://"):
+    if _RTMP_RE.match(url):
         return StreamType.RTMP, "RTMP 스트리밍"
     
     # Direct video (mp4, webm 등)
-    video_exts = [".mp4", ".webm", ".mkv", ".avi", ".mov", ".flv"]
-    for ext in video_exts:
-        if url_lower.endswith(ext):
-            return StreamType.DIRECT, f"직접 영상 URL ({ext})"
+    m = _DIRECT_EXT_RE.search(url)
+    if m:
+        return StreamType.DIRECT, f"직접 영상 URL (.{m.group(1).lower()})"
     
     # HTTP/HTTPS 스트리밍
-    if url_lower.startswith("http://") or url_lower.startswith("https://"):
+    if _HTTP_RE.match(url):
         return StreamType.DIRECT, "HTTP 스트리밍"
     
     return StreamType.UNKNOWN, "알 수 없는 형식"
@@ -875,23 +1121,16 @@ async def detect_stream_url(url: str):
         "type": stream_type.value,
         "description": description,
         "supported": stream_type != StreamType.UNKNOWN,
-        "requires_buffer": stream_type in [StreamType.YOUTUBE_LIVE, StreamType.HLS, StreamType.RTMP],
+        "requires_buffer": stream_type in _BUFFERED_TYPES,
         "buffer_seconds": 3  # 기본 3초 버퍼
     }
     
     # YouTube인 경우 yt-dlp로 추가 정보 가져오기
-    if stream_type in [StreamType.YOUTUBE_LIVE, StreamType.YOUTUBE_VIDEO]:
+    if stream_type in _YOUTUBE_TYPES:
         try:
-            cmd = ["yt-dlp", "--dump-json", "--no-download", url]
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, _ = await asyncio.wait_for(process.communicate(), timeout=10)
+            info = await extract_youtube_info_cached(url, timeout=10)
             
-            if stdout:
-                info = json.loads(stdout.decode())
+            if info:
                 result["title"] = info.get("title", "")
                 result["duration"] = info.get("duration")  # None for live
                 result["is_live"] = info.get("is_live", False)
@@ -907,6 +1146,105 @@ async def detect_stream_url(url: str):
     return result
 
 
+# [advice from AI] /stream/live 고정 이벤트 프레임은 모듈 로드 시 한 번만 직렬화
+SSE_STREAM_READY = sse_event('ready', {'message': '버퍼링 완료! 재생을 시작하세요'})
+
+
+async def _live_stream_events(
+    url: str,
+    stream_type: StreamType,
+    description: str,
+    stt_engine: STTEngine,
+    enable_diarization: bool,
+    buffer_seconds: float
+):
+    """/stream/live SSE 이벤트 생성
+
+    [advice from AI] 핸들러 안 클로저 대신 모듈 함수로 두고 필요한 값은 인자로 전달
+    """
+    start_time = time.time()
+    subtitle_count = 0
+    
+    try:
+        # 1. 스트리밍 정보 전송
+        yield sse_event('init', {'stream_type': stream_type.value, 'description': description, 'buffer_seconds': buffer_seconds})
+        
+        # 2. 스트리밍 URL 처리 (YouTube 여부는 한 번만 판정해서 재사용)
+        is_youtube = stream_type in _YOUTUBE_TYPES
+        stream_url = url
+        if is_youtube:
+            try:
+                # [advice from AI] /stream/detect에서 추출한 정보가 캐시에 있으면 재사용
+                info = await extract_youtube_info_cached(url, timeout=30)
+                
+                yt_url = youtube_stream_url(info)
+                if yt_url:
+                    stream_url = yt_url
+                    logger.debug("[STREAM] YouTube 스트림 URL 추출 완료")
+            except Exception as e:
+                print(f"[STREAM] YouTube URL 추출 실패: {e}")
+                yield sse_event('error', {'message': f'YouTube URL 추출 실패: {str(e)}'})
+                return
+        
+        # 3. video_url 전송 (프론트엔드에서 재생용)
+        # [advice from AI] YouTube URL은 CORS 문제로 프록시 사용
+        if is_youtube:
+            # Base64 URL-safe 인코딩
+            encoded_url = base64.urlsafe_b64encode(stream_url.encode()).decode('utf-8')
+            proxy_url = f"/api/realtime/stream/proxy?url={encoded_url}"
+            logger.debug("[STREAM] 프록시 URL 전송: %.80s", proxy_url)
+            yield sse_event('video_url', {'url': proxy_url})
+        else:
+            # HLS 등 다른 스트림은 직접 전달
+            logger.debug("[STREAM] 영상 URL 전송: %.80s", stream_url)
+            yield sse_event('video_url', {'url': stream_url})
+        
+        # 4. 버퍼링 알림
+        yield sse_event('buffering', {'seconds': buffer_seconds})
+        
+        # 5. 버퍼 시간 대기 후 ready
+        await asyncio.sleep(buffer_seconds)
+        yield SSE_STREAM_READY
+        
+        # 6. [advice from AI] WhisperLiveKit 또는 HAIV 클라이언트 사용
+        stt_generator = open_stt_stream(
+            stt_engine,
+            input_path=stream_url,
+            enable_diarization=enable_diarization,
+            sync_mode=True
+        )
+        
+        print(f"[STREAM] 🎤 STT 시작 (engine={stt_engine.value})")
+        
+        # 7. STT 결과 실시간 스트리밍 (STT는 큐 너머 별도 태스크에서 진행)
+        async for subtitle in decouple_subtitles(stt_generator):
+            subtitle_count += 1
+            # [advice from AI] %-포맷 로깅은 DEBUG 비활성 시 문자열 생성 자체를 생략
+            logger.debug("[STREAM] 자막 #%d: [%.1fs] %.30s", subtitle_count, subtitle.start_time, subtitle.text)
+            # [advice from AI] RealtimeSubtitle 필드가 곧 전송 필드 - dict 생성 없이 dataclass를 바로 직렬화
+            yield SSE_SUBTITLE_PREFIX + orjson.dumps(subtitle) + b"}\n\n"
+        
+        # 완료
+        total_time = time.time() - start_time
+        print(f"[STREAM] ✅ 처리 완료: {subtitle_count}개 자막, {total_time:.1f}초")
+        yield SSE_COMPLETE_TMPL % (subtitle_count, total_time)
+        
+    except Exception as e:
+        print(f"[STREAM] ❌ 오류: {e}")
+        traceback.print_exc()
+        yield sse_event('error', {'message': str(e)})
+
+
+async def _limited_stream(limiter, agen):
+    """동시 스트림 상한 안에서만 제너레이터 실행 (자리가 날 때까지 대기, 종료/취소 시 반환)"""
+    async with limiter.slot():
+        try:
+            async for item in agen:
+                yield item
+        finally:
+            await agen.aclose()
+
+
 @router.get("/stream/live")
 async def start_live_stream_stt(
     url: str,
@@ -926,120 +1264,50 @@ async def start_live_stream_stt(
     if stream_type == StreamType.UNKNOWN:
         raise HTTPException(status_code=400, detail="지원하지 않는 스트리밍 형식입니다")
     
-    print(f"[STREAM] 🚀 실시간 스트리밍 STT 시작")
-    print(f"[STREAM] URL: {url}")
-    print(f"[STREAM] 타입: {description}")
-    print(f"[STREAM] 엔진: {stt_engine.value}")
-    print(f"[STREAM] 버퍼: {buffer_seconds}초")
-    
-    async def stream_event_generator():
-        """
-        [advice from AI] process_video_realtime을 재사용하여 안정적인 STT 처리
-        """
-        start_time = time.time()
-        subtitle_count = 0
-        
-        try:
-            # 1. 스트리밍 정보 전송
-            yield f"data: {json.dumps({'type': 'init', 'data': {'stream_type': stream_type.value, 'description': description, 'buffer_seconds': buffer_seconds}}, ensure_ascii=False)}\n\n"
-            
-            # 2. 스트리밍 URL 처리
-            stream_url = url
-            if stream_type in [StreamType.YOUTUBE_LIVE, StreamType.YOUTUBE_VIDEO]:
-                try:
-                    cmd = ["yt-dlp", "-g", "-f", "best[ext=mp4]/best", url]
-                    process = await asyncio.create_subprocess_exec(
-                        *cmd,
-                        stdout=asyncio.subprocess.PIPE,
-                        stderr=asyncio.subprocess.PIPE
-                    )
-                    stdout, _ = await asyncio.wait_for(process.communicate(), timeout=30)
-                    
-                    if stdout:
-                        stream_url = stdout.decode().strip().split('\n')[0]
-                        print(f"[STREAM] YouTube 스트림 URL 추출 완료")
-                except Exception as e:
-                    print(f"[STREAM] YouTube URL 추출 실패: {e}")
-                    yield f"data: {json.dumps({'type': 'error', 'data': {'message': f'YouTube URL 추출 실패: {str(e)}'}}, ensure_ascii=False)}\n\n"
-                    return
-            
-            # 3. video_url 전송 (프론트엔드에서 재생용)
-            # [advice from AI] YouTube URL은 CORS 문제로 프록시 사용
-            if stream_type in [StreamType.YOUTUBE_LIVE, StreamType.YOUTUBE_VIDEO]:
-                # Base64 URL-safe 인코딩
-                encoded_url = base64.urlsafe_b64encode(stream_url.encode()).decode('utf-8')
-                proxy_url = f"/api/realtime/stream/proxy?url={encoded_url}"
-                print(f"[STREAM] 📺 프록시 URL 전송: {proxy_url[:80]}...")
-                yield f"data: {json.dumps({'type': 'video_url', 'data': {'url': proxy_url}}, ensure_ascii=False)}\n\n"
-            else:
-                # HLS 등 다른 스트림은 직접 전달
-                print(f"[STREAM] 📺 영상 URL 전송: {stream_url[:80]}...")
-                yield f"data: {json.dumps({'type': 'video_url', 'data': {'url': stream_url}}, ensure_ascii=False)}\n\n"
-            
-            # 4. 버퍼링 알림
-            yield f"data: {json.dumps({'type': 'buffering', 'data': {'seconds': buffer_seconds}}, ensure_ascii=False)}\n\n"
-            
-            # 5. 버퍼 시간 대기 후 ready
-            await asyncio.sleep(buffer_seconds)
-            yield f"data: {json.dumps({'type': 'ready', 'data': {'message': '버퍼링 완료! 재생을 시작하세요'}}, ensure_ascii=False)}\n\n"
-            
-            # 6. [advice from AI] WhisperLiveKit 또는 HAIV 클라이언트 사용
-            if stt_engine == STTEngine.WHISPER:
-                stt = WhisperLiveKitSTT()
-                stt_generator = stt.process_audio_stream(
-                    stream_url, 
-                    enable_diarization=enable_diarization, 
-                    sync_mode=True
-                )
-            else:
-                from ..services.realtime_stt import process_video_realtime
-                stt_generator = process_video_realtime(
-                    stream_url, 
-                    enable_diarization=enable_diarization, 
-                    sync_mode=True
-                )
-            
-            print(f"[STREAM] 🎤 STT 시작 (engine={stt_engine.value})")
-            
-            # 7. STT 결과 실시간 스트리밍
-            async for subtitle in stt_generator:
-                subtitle_count += 1
-                subtitle_data = {
-                    "id": subtitle.id,
-                    "start_time": subtitle.start_time,
-                    "end_time": subtitle.end_time,
-                    "text": subtitle.text,
-                    "speaker": subtitle.speaker,
-                    "is_final": subtitle.is_final
-                }
-                print(f"[STREAM] 🎤 자막 #{subtitle_count}: [{subtitle.start_time:.1f}s] {subtitle.text[:30]}...")
-                yield f"data: {json.dumps({'type': 'subtitle', 'data': subtitle_data}, ensure_ascii=False)}\n\n"
-            
-            # 완료
-            total_time = time.time() - start_time
-            print(f"[STREAM] ✅ 처리 완료: {subtitle_count}개 자막, {total_time:.1f}초")
-            yield f"data: {json.dumps({'type': 'complete', 'data': {'total_subtitles': subtitle_count, 'processing_time': total_time}}, ensure_ascii=False)}\n\n"
-            
-        except Exception as e:
-            print(f"[STREAM] ❌ 오류: {e}")
-            import traceback
-            traceback.print_exc()
-            yield f"data: {json.dumps({'type': 'error', 'data': {'message': str(e)}}, ensure_ascii=False)}\n\n"
+    # [advice from AI] 시작 배너는 요청당 한 번만 (SSE 제너레이터 밖에서 출력)
+    print(f"[STREAM] 🚀 실시간 스트리밍 STT 시작 - URL: {url}, 타입: {description}, "
+          f"엔진: {stt_engine.value}, 버퍼: {buffer_seconds}초")
     
-    return StreamingResponse(
-        stream_event_generator(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no"
-        }
-    )
+    return sse_response(_limited_stream(live_stream_limiter, _live_stream_events(
+        url, stream_type, description, stt_engine, enable_diarization, buffer_seconds
+    )))
 
 
 # [advice from AI] 비디오 프록시 - YouTube CORS 우회
-import base64
-import urllib.parse
+# [advice from AI] 프록시용 HTTP 클라이언트를 프로세스 전체에서 재사용 (시크마다 TCP/TLS 핸드셰이크 생략)
+PROXY_STREAM_TIMEOUT = httpx.Timeout(60.0, connect=30.0)
+PROXY_CHUNK_SIZE = 1 << 20  # 청크당 파이썬 처리 횟수 감소
+
+# [advice from AI] 프록시 입력 검증 - 과도한 길이의 Base64 디코딩 방지 + 허용 호스트만 중계 (SSRF 방지)
+PROXY_MAX_ENCODED_URL = 4096
+PROXY_ALLOWED_HOST_RE = re.compile(
+    os.getenv("PROXY_ALLOWED_HOST_PATTERN", r"(^|\.)(googlevideo\.com|youtube\.com)$"),
+    re.IGNORECASE
+)
+_URLSAFE_B64_TABLE = str.maketrans("-_", "+/")
+_PROXY_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def _proxy_client() -> httpx.AsyncClient:
+    """비디오 프록시 HTTP 클라이언트 (연결 재사용)"""
+    global _PROXY_CLIENT
+    if _PROXY_CLIENT is None:
+        _PROXY_CLIENT = httpx.AsyncClient(
+            timeout=PROXY_STREAM_TIMEOUT,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=64)
+        )
+    return _PROXY_CLIENT
+
+
+async def close_http_clients():
+    """공유 HTTP 클라이언트 종료 (앱 shutdown에서 호출)"""
+    global _PROXY_CLIENT, _MONITOR_CLIENT
+    if _PROXY_CLIENT is not None:
+        await _PROXY_CLIENT.aclose()
+        _PROXY_CLIENT = None
+    if _MONITOR_CLIENT is not None:
+        await _MONITOR_CLIENT.aclose()
+        _MONITOR_CLIENT = None
 
 
 @router.get("/stream/proxy")
@@ -1050,13 +1318,22 @@ async def proxy_video_stream(url: str, request: Request):
     
     URL을 Base64로 디코딩하여 사용 (서버 재시작 후에도 동작)
     """
+    if len(url) > PROXY_MAX_ENCODED_URL:
+        raise HTTPException(status_code=414, detail="URL이 너무 깁니다")
+    
     try:
-        # Base64 URL-safe 디코딩
-        video_url = base64.urlsafe_b64decode(url).decode('utf-8')
-    except Exception as e:
+        # Base64 URL-safe 디코딩 (binascii 직접 호출, URL은 ASCII)
+        video_url = binascii.a2b_base64(url.translate(_URLSAFE_B64_TABLE) + "==").decode("ascii")
+    except (binascii.Error, UnicodeDecodeError) as e:
         print(f"[PROXY] ❌ URL 디코딩 실패: {e}")
         raise HTTPException(status_code=400, detail="잘못된 URL 형식입니다")
     
+    # [advice from AI] 업스트림 연결 전에 스킴/호스트 확인
+    parts = urllib.parse.urlsplit(video_url)
+    if parts.scheme not in ("http", "https") or not PROXY_ALLOWED_HOST_RE.search(parts.hostname or ""):
+        print(f"[PROXY] ❌ 허용되지 않은 URL: {video_url[:60]}")
+        raise HTTPException(status_code=400, detail="허용되지 않은 URL입니다")
+    
     print(f"[PROXY] 🎬 비디오 스트리밍 시작: {video_url[:60]}...")
     
     # Range 헤더 처리 (비디오 시크 지원)
@@ -1072,125 +1349,130 @@ async def proxy_video_stream(url: str, request: Request):
         headers["Range"] = range_header
         print(f"[PROXY] 📍 Range 요청: {range_header}")
     
-    async def stream_video():
-        async with httpx.AsyncClient(timeout=httpx.Timeout(60.0, connect=30.0)) as client:
-            try:
-                async with client.stream("GET", video_url, headers=headers) as response:
-                    # 응답 헤더 로깅
-                    content_length = response.headers.get("content-length", "unknown")
-                    content_type = response.headers.get("content-type", "video/mp4")
-                    print(f"[PROXY] 📦 응답: {response.status_code}, {content_type}, {content_length} bytes")
-                    
-                    async for chunk in response.aiter_bytes(chunk_size=65536):
-                        yield chunk
-            except Exception as e:
-                print(f"[PROXY] ❌ 스트리밍 오류: {e}")
-                raise
+    # [advice from AI] 업스트림 GET 한 번으로 상태/헤더 확인 후 같은 응답을 그대로 전달 (HEAD/중복 GET 제거)
+    # [advice from AI] 동시 프록시 스트림 상한 - 자리는 스트리밍이 끝날 때 반환
+    await proxy_stream_limiter.acquire()
+    client = _proxy_client()
+    try:
+        upstream = await client.send(
+            client.build_request("GET", video_url, headers=headers),
+            stream=True,
+            follow_redirects=True
+        )
+    except httpx.HTTPError as e:
+        await proxy_stream_limiter.release()
+        print(f"[PROXY] ❌ 업스트림 연결 실패: {e}")
+        raise HTTPException(status_code=502, detail="영상 서버에 연결할 수 없습니다")
+    except BaseException:
+        await proxy_stream_limiter.release()
+        raise
+    
+    content_type = upstream.headers.get("content-type", "video/mp4")
+    print(f"[PROXY] 📦 응답: {upstream.status_code}, {content_type}, {upstream.headers.get('content-length', 'unknown')} bytes")
+    
+    response_headers = {
+        "Content-Type": content_type,
+        "Accept-Ranges": upstream.headers.get("accept-ranges", "bytes"),
+        "Access-Control-Allow-Origin": "*",
+        "Access-Control-Allow-Methods": "GET, HEAD, OPTIONS",
+        "Access-Control-Allow-Headers": "Range",
+        "Cache-Control": "no-cache"
+    }
+    for name in ("content-length", "content-range"):
+        if name in upstream.headers:
+            response_headers[name.title()] = upstream.headers[name]
+    
+    # [advice from AI] 자리 반환은 스트림 종료/백그라운드 태스크 중 먼저 도달한 쪽에서 한 번만
+    # (본문을 한 번도 읽기 전에 클라이언트가 끊으면 제너레이터 finally가 실행되지 않음)
+    slot_held = True
     
-    # 원본 비디오 헤더 가져오기
-    async with httpx.AsyncClient(timeout=httpx.Timeout(30.0)) as client:
+    async def release_slot():
+        nonlocal slot_held
+        if slot_held:
+            slot_held = False
+            await proxy_stream_limiter.release()
+    
+    async def finish():
         try:
-            head_headers = headers.copy()
-            head_response = await client.head(video_url, headers=head_headers, follow_redirects=True)
-            
-            content_length = head_response.headers.get("content-length")
-            content_type = head_response.headers.get("content-type", "video/mp4")
-            accept_ranges = head_response.headers.get("accept-ranges", "bytes")
-            
-            response_headers = {
-                "Content-Type": content_type,
-                "Accept-Ranges": accept_ranges,
-                "Access-Control-Allow-Origin": "*",
-                "Access-Control-Allow-Methods": "GET, HEAD, OPTIONS",
-                "Access-Control-Allow-Headers": "Range",
-                "Cache-Control": "no-cache"
-            }
-            
-            if content_length:
-                response_headers["Content-Length"] = content_length
-            
-            # Range 요청이면 206 반환
-            if range_header:
-                # Range 응답 처리
-                async with client.stream("GET", video_url, headers=headers) as range_resp:
-                    content_range = range_resp.headers.get("content-range")
-                    if content_range:
-                        response_headers["Content-Range"] = content_range
-                    range_content_length = range_resp.headers.get("content-length")
-                    if range_content_length:
-                        response_headers["Content-Length"] = range_content_length
-                    
-                    return StreamingResponse(
-                        stream_video(),
-                        status_code=206,
-                        headers=response_headers,
-                        media_type=content_type
-                    )
-            
-            return StreamingResponse(
-                stream_video(),
-                status_code=200,
-                headers=response_headers,
-                media_type=content_type
-            )
-            
+            await upstream.aclose()
+        finally:
+            await release_slot()
+    
+    async def stream_video():
+        try:
+            # Accept-Encoding: identity이므로 디코딩 단계 없이 원본 바이트 전달
+            async for chunk in upstream.aiter_raw(PROXY_CHUNK_SIZE):
+                yield chunk
         except Exception as e:
-            print(f"[PROXY] ❌ HEAD 요청 실패: {e}")
-            # HEAD 실패 시에도 스트리밍 시도
-            return StreamingResponse(
-                stream_video(),
-                status_code=200,
-                headers={
-                    "Content-Type": "video/mp4",
-                    "Accept-Ranges": "bytes",
-                    "Access-Control-Allow-Origin": "*"
-                },
-                media_type="video/mp4"
-            )
+            print(f"[PROXY] ❌ 스트리밍 오류: {e}")
+            raise
+        finally:
+            await release_slot()
+    
+    # 클라이언트가 먼저 끊어도 업스트림 연결과 동시 스트림 자리는 응답 종료 후 반드시 반환
+    return StreamingResponse(
+        stream_video(),
+        status_code=upstream.status_code,
+        headers=response_headers,
+        media_type=content_type,
+        background=BackgroundTask(finish)
+    )
 
 
 # =============================================================================
 # [advice from AI] HAIV 모니터링 프록시 - 관리자 화면 임베드용
 # =============================================================================
 
-# 모니터링 세션 저장 (로그인 쿠키)
-_monitor_session = None
-_monitor_cookies = {}
-
 HAIV_MONITOR_URL = "http://49.50.136.163:40001"
 HAIV_MONITOR_CREDENTIALS = {
     "username": "timbel",
     "password": "1q2w3e4r!"
 }
 
+# [advice from AI] href="/..." / src='/...' 루트 상대 경로 → 모니터 서버 절대 경로
+# 응답 본문을 str로 디코딩하지 않고 바이트 그대로 치환
+_MONITOR_ROOT_LINK_RE = re.compile(rb"""(href|src)=(["'])/""")
+_MONITOR_ROOT_LINK_REPL = rb"\g<1>=\g<2>" + HAIV_MONITOR_URL.encode() + b"/"
+
+# [advice from AI] 모니터 서버 전용 HTTP 클라이언트 - 연결 재사용 + 쿠키 저장소에 로그인 세션 유지
+_MONITOR_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def _monitor_client() -> httpx.AsyncClient:
+    """HAIV 모니터 HTTP 클라이언트 (연결/세션 재사용)"""
+    global _MONITOR_CLIENT
+    if _MONITOR_CLIENT is None:
+        _MONITOR_CLIENT = httpx.AsyncClient(
+            timeout=30.0,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=16, keepalive_expiry=60.0)
+        )
+    return _MONITOR_CLIENT
+
 
 @router.get("/monitor/login")
 async def monitor_login():
     """
     HAIV 관리자 화면 로그인 (세션 쿠키 획득)
     """
-    global _monitor_cookies
-    
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            # 로그인 페이지에서 CSRF 토큰 등 획득 (필요시)
-            login_url = f"{HAIV_MONITOR_URL}/api/auth/login"
-            
-            # 로그인 요청
-            response = await client.post(
-                login_url,
-                json=HAIV_MONITOR_CREDENTIALS,
-                follow_redirects=True
-            )
+        client = _monitor_client()
+        # 로그인 페이지에서 CSRF 토큰 등 획득 (필요시)
+        login_url = f"{HAIV_MONITOR_URL}/api/auth/login"
+        
+        # 로그인 요청 (응답 쿠키는 클라이언트 쿠키 저장소에 보관되어 이후 프록시 요청에 사용)
+        response = await client.post(
+            login_url,
+            json=HAIV_MONITOR_CREDENTIALS
+        )
+        
+        if response.status_code == 200:
+            print(f"[MONITOR] ✅ 로그인 성공! cookies: {list(client.cookies.keys())}")
+            return {"status": "success", "message": "로그인 성공"}
+        else:
+            print(f"[MONITOR] ❌ 로그인 실패: {response.status_code}")
+            return {"status": "error", "message": f"로그인 실패: {response.status_code}"}
             
-            if response.status_code == 200:
-                _monitor_cookies = dict(response.cookies)
-                print(f"[MONITOR] ✅ 로그인 성공! cookies: {list(_monitor_cookies.keys())}")
-                return {"status": "success", "message": "로그인 성공"}
-            else:
-                print(f"[MONITOR] ❌ 로그인 실패: {response.status_code}")
-                return {"status": "error", "message": f"로그인 실패: {response.status_code}"}
-                
     except Exception as e:
         print(f"[MONITOR] ❌ 로그인 오류: {e}")
         return {"status": "error", "message": str(e)}
@@ -1204,38 +1486,38 @@ async def monitor_proxy(path: str = "saiz_fnt"):
     - iframe에서 호출하여 관리자 화면을 임베드
     - 자동 로그인 세션 사용
     """
-    from fastapi.responses import HTMLResponse
     
     target_url = f"{HAIV_MONITOR_URL}/{path}"
     
     try:
-        async with httpx.AsyncClient(timeout=30.0, cookies=_monitor_cookies) as client:
-            response = await client.get(target_url, follow_redirects=True)
+        response = await _monitor_client().get(target_url)
+        
+        if response.status_code == 200:
+            content_type = response.headers.get("content-type", "text/html")
+            
+            # [advice from AI] HTML이 아닌 자원(CSS/JS/이미지)은 치환 없이 원본 바이트 그대로 전달
+            if "html" not in content_type:
+                return Response(content=response.content, media_type=content_type)
+            
+            # [advice from AI] 상대 경로를 프록시 경로로 변환 (정규식 한 번으로 href/src 모두 처리)
+            content = _MONITOR_ROOT_LINK_RE.sub(_MONITOR_ROOT_LINK_REPL, response.content)
+            
+            # X-Frame-Options 제거를 위해 직접 HTML 반환 (원본 charset 유지)
+            return HTMLResponse(
+                content=content,
+                status_code=200,
+                media_type=content_type,
+                headers={
+                    "X-Frame-Options": "ALLOWALL",
+                    "Content-Security-Policy": "frame-ancestors *"
+                }
+            )
+        else:
+            return HTMLResponse(
+                content=f"<h1>Error {response.status_code}</h1><p>관리자 화면에 접근할 수 없습니다.</p>",
+                status_code=response.status_code
+            )
             
-            if response.status_code == 200:
-                content = response.text
-                
-                # [advice from AI] 상대 경로를 프록시 경로로 변환
-                content = content.replace('href="/', f'href="{HAIV_MONITOR_URL}/')
-                content = content.replace("href='/", f"href='{HAIV_MONITOR_URL}/")
-                content = content.replace('src="/', f'src="{HAIV_MONITOR_URL}/')
-                content = content.replace("src='/", f"src='{HAIV_MONITOR_URL}/")
-                
-                # X-Frame-Options 제거를 위해 직접 HTML 반환
-                return HTMLResponse(
-                    content=content,
-                    status_code=200,
-                    headers={
-                        "X-Frame-Options": "ALLOWALL",
-                        "Content-Security-Policy": "frame-ancestors *"
-                    }
-                )
-            else:
-                return HTMLResponse(
-                    content=f"<h1>Error {response.status_code}</h1><p>관리자 화면에 접근할 수 없습니다.</p>",
-                    status_code=response.status_code
-                )
-                
     except Exception as e:
         print(f"[MONITOR] ❌ 프록시 오류: {e}")
         return HTMLResponse(
@@ -2,9 +2,8 @@
 
 import os
 import tempfile
-import aiofiles
-from fastapi import APIRouter, UploadFile, File, HTTPException, BackgroundTasks
-from fastapi.responses import PlainTextResponse
+from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi.responses import PlainTextResponse, Response
 from typing import Optional
 
 from ..models.subtitle import (
@@ -15,12 +14,15 @@ from ..models.subtitle import (
 )
 from ..services.stt_service import stt_service
 from ..services.subtitle_service import subtitle_service
+from ..services.upload_storage import upload_path, save_upload
 
 router = APIRouter(prefix="/api/transcribe", tags=["transcribe"])
 
-# [advice from AI] 업로드된 파일 저장 디렉토리
-UPLOAD_DIR = os.getenv("UPLOAD_DIR", "/tmp/ktv-uploads")
-os.makedirs(UPLOAD_DIR, exist_ok=True)
+# [advice from AI] 업로드 최대 크기 (0이면 제한 없음) - 초과 시 디스크 복사/STT 전에 거부
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", "0"))
+
+# [advice from AI] 업로드 허용 동영상/음성 확장자
+ALLOWED_MEDIA_EXTENSIONS = frozenset({".mp4", ".mp3", ".wav", ".webm", ".ogg", ".m4a", ".flac"})
 
 
 @router.post("/", response_model=STTResponse)
@@ -36,22 +38,25 @@ async def transcribe_video(
     """
     
     # [advice from AI] 파일 형식 검증
-    allowed_extensions = {".mp4", ".mp3", ".wav", ".webm", ".ogg", ".m4a", ".flac"}
     file_ext = os.path.splitext(file.filename)[1].lower()
     
-    if file_ext not in allowed_extensions:
+    if file_ext not in ALLOWED_MEDIA_EXTENSIONS:
         raise HTTPException(
             status_code=400,
-            detail=f"지원하지 않는 파일 형식입니다. 지원 형식: {', '.join(allowed_extensions)}"
+            detail=f"지원하지 않는 파일 형식입니다. 지원 형식: {', '.join(ALLOWED_MEDIA_EXTENSIONS)}"
+        )
+    
+    if MAX_UPLOAD_BYTES and file.size is not None and file.size > MAX_UPLOAD_BYTES:
+        raise HTTPException(
+            status_code=413,
+            detail=f"파일이 너무 큽니다. 최대 {MAX_UPLOAD_BYTES // (1 << 20)}MB까지 업로드할 수 있습니다."
         )
     
     # [advice from AI] 파일 저장
-    temp_file_path = os.path.join(UPLOAD_DIR, f"upload_{os.urandom(8).hex()}{file_ext}")
+    temp_file_path = upload_path("upload", file, file_ext)
     
     try:
-        async with aiofiles.open(temp_file_path, "wb") as f:
-            content = await file.read()
-            await f.write(content)
+        await save_upload(file, temp_file_path)
         
         # [advice from AI] HAIV STT 처리
         result = await stt_service.transcribe(
@@ -82,8 +87,9 @@ async def export_srt(request: SubtitleExportRequest):
             segments=request.segments,
             include_speaker=request.include_speaker
         )
-        return PlainTextResponse(
-            content=srt_content,
+        # [advice from AI] 한 번만 UTF-8로 인코딩해서 바이트로 응답 (PlainTextResponse 재인코딩 생략)
+        return Response(
+            content=srt_content.encode("utf-8"),
             media_type="text/plain; charset=utf-8",
             headers={"Content-Disposition": "attachment; filename=subtitle.srt"}
         )
@@ -104,8 +110,9 @@ async def export_vtt(request: SubtitleExportRequest):
             segments=request.segments,
             include_speaker=request.include_speaker
         )
-        return PlainTextResponse(
-            content=vtt_content,
+        # [advice from AI] 한 번만 UTF-8로 인코딩해서 바이트로 응답 (PlainTextResponse 재인코딩 생략)
+        return Response(
+            content=vtt_content.encode("utf-8"),
             media_type="text/plain; charset=utf-8",
             headers={"Content-Disposition": "attachment; filename=subtitle.vtt"}
         )
@@ -1,49 +1,48 @@
 # [advice from AI] Services 모듈 초기화
+# 패키지 import 시 모든 STT/파이프라인 모듈을 읽지 않도록 재노출 이름은 처음 접근할 때 로드 (PEP 562)
 
+import importlib
+
+# [advice from AI] 서브모듈과 이름이 같은 싱글톤은 즉시 로드
+# (서브모듈 import 시 패키지 속성이 모듈 객체로 덮여 __getattr__가 호출되지 않으므로, 여기서 인스턴스로 고정)
 from .stt_service import stt_service
 from .subtitle_service import subtitle_service
 from .audio_extractor import audio_extractor
-from .pipeline import STTPipeline, process_video, PipelineProgress, PipelineResult, PipelineStage
-from .realtime_pipeline import (
-    RealtimeSTTPipeline,
-    stream_process_video,
-    StreamEvent,
-    StreamEventType
-)
-from .realtime_stt import (
-    HAIVStreamingSTT,
-    process_video_realtime,
-    RealtimeSubtitle
-)
-from .whisper_stt_client import (
-    WhisperStreamingSTT,
-    WhisperConfig,
-    process_video_with_whisper
-)
-from .live_stt_service import (
-    LiveSTTService,
-    LiveSTTConfig
-)
-
-__all__ = [
-    "stt_service",
-    "subtitle_service",
-    "audio_extractor",
-    "STTPipeline",
-    "process_video",
-    "PipelineProgress",
-    "PipelineResult",
-    "PipelineStage",
-    "RealtimeSTTPipeline",
-    "stream_process_video",
-    "StreamEvent",
-    "StreamEventType",
-    "HAIVStreamingSTT",
-    "process_video_realtime",
-    "RealtimeSubtitle",
-    "WhisperStreamingSTT",
-    "WhisperConfig",
-    "process_video_with_whisper",
-    "LiveSTTService",
-    "LiveSTTConfig"
-]
+
+# [advice from AI] 재노출 이름 → 정의 모듈 (처음 접근할 때 로드)
+_LAZY_EXPORTS = {
+    "STTPipeline": ".pipeline",
+    "process_video": ".pipeline",
+    "PipelineProgress": ".pipeline",
+    "PipelineResult": ".pipeline",
+    "PipelineStage": ".pipeline",
+    "RealtimeSTTPipeline": ".realtime_pipeline",
+    "stream_process_video": ".realtime_pipeline",
+    "StreamEvent": ".realtime_pipeline",
+    "StreamEventType": ".realtime_pipeline",
+    "HAIVStreamingSTT": ".realtime_stt",
+    "process_video_realtime": ".realtime_stt",
+    "RealtimeSubtitle": ".realtime_stt",
+    "WhisperStreamingSTT": ".whisper_stt_client",
+    "WhisperConfig": ".whisper_stt_client",
+    "process_video_with_whisper": ".whisper_stt_client",
+    "LiveSTTService": ".live_stt_service",
+    "LiveSTTConfig": ".live_stt_service",
+    "BatchedWhisperClient": ".batched_whisper_client",
+    "batched_whisper": ".batched_whisper_client",
+}
+
+__all__ = ["stt_service", "subtitle_service", "audio_extractor", *_LAZY_EXPORTS]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
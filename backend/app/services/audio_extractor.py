@@ -1,11 +1,16 @@
 # [advice from AI] 오디오 추출 서비스 - FFmpeg를 사용하여 MP4에서 오디오 추출
 
 import os
+import json
+import shutil
 import asyncio
-import subprocess
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional, Tuple
 
+# [advice from AI] ffmpeg 파이프 읽기 버퍼 (기본 64KiB → 1MiB)
+FFMPEG_PIPE_LIMIT = 1 << 20
+
 
 class AudioExtractor:
     """MP4에서 오디오를 추출하는 서비스"""
@@ -15,56 +20,66 @@ class AudioExtractor:
     DEFAULT_CHANNELS = 1        # 모노
     DEFAULT_FORMAT = "wav"      # WAV 형식
     
+    # [advice from AI] ffprobe 결과 캐시 크기 - (경로, mtime, 크기)가 같으면 재조회하지 않음
+    PROBE_CACHE_SIZE = 256
+    
     def __init__(self):
         self.ffmpeg_path = self._find_ffmpeg()
+        self._probe_cache: OrderedDict = OrderedDict()
     
     def _find_ffmpeg(self) -> str:
         """FFmpeg 경로 찾기"""
-        # 시스템 PATH에서 찾기
-        result = subprocess.run(
-            ["which", "ffmpeg"],
-            capture_output=True,
-            text=True
-        )
-        if result.returncode == 0:
-            return result.stdout.strip()
-        return "ffmpeg"  # 기본값
+        # [advice from AI] 시스템 PATH에서 찾기 (which 프로세스 실행 없이)
+        return shutil.which("ffmpeg") or "ffmpeg"  # 기본값
     
     def is_available(self) -> bool:
         """FFmpeg 사용 가능 여부 확인"""
-        try:
-            result = subprocess.run(
-                [self.ffmpeg_path, "-version"],
-                capture_output=True,
-                timeout=5
-            )
-            return result.returncode == 0
-        except Exception:
-            return False
+        # [advice from AI] 실행 파일 존재 확인으로 대체 (헬스체크마다 ffmpeg -version 프로세스 생성 생략)
+        return shutil.which(self.ffmpeg_path) is not None
     
-    def get_media_info(self, input_path: str) -> dict:
-        """미디어 파일 정보 조회"""
+    async def _run_ffprobe(self, input_path: str) -> dict:
+        cmd = [
+            "ffprobe",
+            "-v", "quiet",
+            "-print_format", "json",
+            "-show_format",
+            "-show_streams",
+            input_path
+        ]
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        stdout, _ = await process.communicate()
+        
+        if process.returncode == 0:
+            return json.loads(stdout)
+        return {}
+    
+    async def get_media_info(self, input_path: str) -> dict:
+        """미디어 파일 정보 조회 (이벤트 루프를 막지 않는 ffprobe + 결과 캐시)"""
         try:
-            cmd = [
-                "ffprobe",
-                "-v", "quiet",
-                "-print_format", "json",
-                "-show_format",
-                "-show_streams",
-                input_path
-            ]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            st = os.stat(input_path)
+            key = (input_path, st.st_mtime_ns, st.st_size)
             
-            if result.returncode == 0:
-                import json
-                return json.loads(result.stdout)
-            return {}
+            info = self._probe_cache.get(key)
+            if info is not None:
+                self._probe_cache.move_to_end(key)
+                return info
+            
+            info = await self._run_ffprobe(input_path)
+            if info:
+                self._probe_cache[key] = info
+                if len(self._probe_cache) > self.PROBE_CACHE_SIZE:
+                    self._probe_cache.popitem(last=False)
+            return info
         except Exception:
             return {}
     
-    def get_duration(self, input_path: str) -> float:
+    async def get_duration(self, input_path: str) -> float:
         """미디어 파일 길이(초) 조회"""
-        info = self.get_media_info(input_path)
+        info = await self.get_media_info(input_path)
         try:
             return float(info.get("format", {}).get("duration", 0))
         except (ValueError, TypeError):
@@ -111,14 +126,18 @@ class AudioExtractor:
         cmd = [
             self.ffmpeg_path,
             "-y",  # 덮어쓰기
-            "-i", input_path,
+            "-nostats",  # 진행률 출력 생략 (stderr에는 오류만)
         ]
         
         # 시작 시간 설정
+        # [advice from AI] -i 앞의 입력 옵션으로 두어 처음부터 디코딩하지 않고 바로 시크
+        # (오디오를 다시 인코딩하므로 ffmpeg 기본 accurate_seek으로 시작 위치는 정확히 유지)
         if start_time is not None:
             cmd.extend(["-ss", str(start_time)])
         
-        # 길이 설정
+        cmd.extend(["-i", input_path])
+        
+        # 길이 설정 (출력 옵션)
         if duration is not None:
             cmd.extend(["-t", str(duration)])
         
@@ -136,13 +155,15 @@ class AudioExtractor:
             print(f"[AudioExtractor] Running: {' '.join(cmd)}")
             
             # [advice from AI] 비동기 프로세스 실행
+            # stdout은 쓰지 않으므로 DEVNULL, stderr는 communicate()가 실행 중 계속 비우고 읽기 버퍼는 1MiB
             process = await asyncio.create_subprocess_exec(
                 *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+                limit=FFMPEG_PIPE_LIMIT
             )
             
-            stdout, stderr = await process.communicate()
+            _, stderr = await process.communicate()
             
             if process.returncode != 0:
                 error_msg = stderr.decode() if stderr else "Unknown error"
@@ -166,7 +187,8 @@ class AudioExtractor:
         output_dir: str,
         chunk_duration: float = 300.0,  # 5분 단위
         sample_rate: int = DEFAULT_SAMPLE_RATE,
-        channels: int = DEFAULT_CHANNELS
+        channels: int = DEFAULT_CHANNELS,
+        batch: bool = True
     ) -> Tuple[bool, list, str]:
         """
         긴 영상을 청크 단위로 분할하여 오디오 추출
@@ -177,18 +199,26 @@ class AudioExtractor:
             chunk_duration: 청크 길이 (초, 기본: 300초 = 5분)
             sample_rate: 샘플레이트
             channels: 채널 수
+            batch: True면 ffmpeg 한 번(segment muxer)으로 전체 분할, False면 청크마다 ffmpeg 실행
         
         Returns:
             Tuple[성공여부, 출력파일목록, 메시지]
         """
         
-        total_duration = self.get_duration(input_path)
+        total_duration = await self.get_duration(input_path)
         if total_duration <= 0:
             return False, [], "영상 길이를 확인할 수 없습니다"
         
         os.makedirs(output_dir, exist_ok=True)
         
         input_stem = Path(input_path).stem
+        
+        if batch:
+            return await self._extract_audio_segments(
+                input_path, output_dir, input_stem, total_duration,
+                chunk_duration, sample_rate, channels
+            )
+        
         output_files = []
         
         chunk_index = 0
@@ -227,6 +257,80 @@ class AudioExtractor:
             chunk_index += 1
         
         return True, output_files, f"{len(output_files)}개 청크 추출 완료"
+    
+    async def _extract_audio_segments(
+        self,
+        input_path: str,
+        output_dir: str,
+        input_stem: str,
+        total_duration: float,
+        chunk_duration: float,
+        sample_rate: int,
+        channels: int
+    ) -> Tuple[bool, list, str]:
+        """ffmpeg segment muxer로 한 번에 청크 분할
+        
+        [advice from AI] 청크마다 프로세스 생성 + 컨테이너 재파싱/시크 없이 입력을 한 번만 읽어 순서대로 기록
+        """
+        # segment muxer 출력 패턴 (파일명의 %는 이스케이프)
+        pattern = os.path.join(output_dir, f"{input_stem.replace('%', '%%')}_chunk_%03d.wav")
+        cmd = [
+            self.ffmpeg_path,
+            "-y",
+            "-nostats",
+            "-i", input_path,
+            "-vn",
+            "-acodec", "pcm_s16le",
+            "-ar", str(sample_rate),
+            "-ac", str(channels),
+            "-f", "segment",
+            "-segment_time", str(chunk_duration),
+            "-reset_timestamps", "1",
+            pattern
+        ]
+        
+        try:
+            # [advice from AI] 같은 이름으로 이전에 더 길게 분할한 청크가 남아 있으면 추가 청크로 잘못 집계되므로 먼저 삭제
+            chunk_prefix = f"{input_stem}_chunk_"
+            for name in os.listdir(output_dir):
+                if name.startswith(chunk_prefix) and name.endswith(".wav") and name[len(chunk_prefix):-4].isdigit():
+                    os.remove(os.path.join(output_dir, name))
+            
+            print(f"[AudioExtractor] Running: {' '.join(cmd)}")
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+                limit=FFMPEG_PIPE_LIMIT
+            )
+            _, stderr = await process.communicate()
+        except Exception as e:
+            return False, [], f"청크 분할 중 오류: {str(e)}"
+        
+        if process.returncode != 0:
+            error_msg = stderr.decode(errors="replace") if stderr else "Unknown error"
+            print(f"[AudioExtractor] Error: {error_msg}")
+            return False, [], f"청크 분할 실패: {error_msg}"
+        
+        output_files = []
+        chunk_index = 0
+        while True:
+            chunk_output = os.path.join(output_dir, f"{input_stem}_chunk_{chunk_index:03d}.wav")
+            if not os.path.exists(chunk_output):
+                break
+            start_time = float(chunk_index * chunk_duration)
+            output_files.append({
+                "index": chunk_index,
+                "path": chunk_output,
+                "start_time": start_time,
+                "duration": max(0.0, min(chunk_duration, total_duration - start_time))
+            })
+            chunk_index += 1
+        
+        if not output_files:
+            return False, [], "출력 파일이 생성되지 않았습니다"
+        
+        return True, output_files, f"{len(output_files)}개 청크 추출 완료"
 
 
 # 싱글톤 인스턴스
@@ -0,0 +1,94 @@
+# [advice from AI] faster-whisper 배치 추론 클라이언트 - 파일 전체 처리(/process)용
+# 실시간 스트리밍이 필요 없는 경로에서 BatchedInferencePipeline으로 한 번에 디코딩
+# faster-whisper 설치 + FASTER_WHISPER_MODEL 설정 시에만 사용 (미설정 시 WhisperLiveKit 스트리밍 사용)
+
+import os
+import asyncio
+import threading
+from typing import AsyncGenerator, List
+
+from .realtime_stt import RealtimeSubtitle
+from .postprocessing import postprocess_text, is_hallucination
+
+try:
+    from faster_whisper import WhisperModel, BatchedInferencePipeline
+except ImportError:
+    WhisperModel = None
+    BatchedInferencePipeline = None
+
+# [advice from AI] faster-whisper 설정 (모델 경로가 비어 있으면 비활성화)
+FASTER_WHISPER_MODEL = os.getenv("FASTER_WHISPER_MODEL", "")
+FASTER_WHISPER_DEVICE = os.getenv("FASTER_WHISPER_DEVICE", "cuda")
+# [advice from AI] CTranslate2 int8 양자화 기본 (GPU: int8 가중치 + FP16 연산, CPU: int8)
+FASTER_WHISPER_COMPUTE_TYPE = os.getenv(
+    "FASTER_WHISPER_COMPUTE_TYPE",
+    "int8_float16" if FASTER_WHISPER_DEVICE == "cuda" else "int8"
+)
+FASTER_WHISPER_BATCH_SIZE = int(os.getenv("FASTER_WHISPER_BATCH_SIZE", "16"))
+
+
+class BatchedWhisperClient:
+    """faster-whisper BatchedInferencePipeline 래퍼 (모델은 프로세스당 한 번만 로드)"""
+
+    def __init__(self):
+        self.model_path = FASTER_WHISPER_MODEL
+        self.batch_size = FASTER_WHISPER_BATCH_SIZE
+        self._pipeline = None
+        self._lock = threading.Lock()
+
+    def is_available(self) -> bool:
+        """faster-whisper 설치 및 모델 경로 설정 여부"""
+        return BatchedInferencePipeline is not None and bool(self.model_path)
+
+    def _get_pipeline(self):
+        with self._lock:
+            if self._pipeline is None:
+                print(f"[BATCH-WHISPER] 🧠 모델 로드: {self.model_path} ({FASTER_WHISPER_DEVICE}, {FASTER_WHISPER_COMPUTE_TYPE})")
+                model = WhisperModel(
+                    self.model_path,
+                    device=FASTER_WHISPER_DEVICE,
+                    compute_type=FASTER_WHISPER_COMPUTE_TYPE
+                )
+                self._pipeline = BatchedInferencePipeline(model=model)
+            return self._pipeline
+
+    def _transcribe_sync(self, input_path: str) -> List[RealtimeSubtitle]:
+        pipeline = self._get_pipeline()
+        segments, _ = pipeline.transcribe(
+            input_path,
+            language="ko",
+            batch_size=self.batch_size,
+            word_timestamps=False
+        )
+
+        subtitles = []
+        # segments는 제너레이터 - 순회하면서 실제 디코딩 수행
+        for segment in segments:
+            raw_text = segment.text.strip()
+
+            # WhisperLiveKit 경로와 동일한 후처리 (할루시네이션 필터 → 정리/사전/비속어)
+            if not raw_text or is_hallucination(raw_text):
+                continue
+            processed_text = postprocess_text(raw_text)
+            if not processed_text:
+                continue
+
+            subtitles.append(RealtimeSubtitle(
+                id=len(subtitles) + 1,
+                start_time=float(segment.start),
+                end_time=float(segment.end),
+                text=processed_text,
+                is_final=True
+            ))
+        return subtitles
+
+    async def process_file(self, input_path: str) -> AsyncGenerator[RealtimeSubtitle, None]:
+        """파일 전체를 배치 추론 후 자막 전달 (GPU 추론은 워커 스레드에서 실행)"""
+        subtitles = await asyncio.to_thread(self._transcribe_sync, input_path)
+        print(f"[BATCH-WHISPER] ✅ 배치 추론 완료: {len(subtitles)}개 자막")
+        for subtitle in subtitles:
+            yield subtitle
+
+
+# 싱글톤 인스턴스
+batched_whisper = BatchedWhisperClient()
@@ -2,11 +2,13 @@
 
 import asyncio
 import os
-import json
+import orjson
 from typing import AsyncGenerator, Optional
 from dataclasses import dataclass
 import websockets
 
+from .audio_extractor import audio_extractor
+
 
 @dataclass
 class HAIVConfig:
@@ -18,7 +20,14 @@ class HAIVConfig:
     num_speaker: Optional[int] = None
     language: str = "ko"
     verbosity: str = "final"
-    norealtime: bool = False
+    # [advice from AI] 파일 처리 클라이언트이므로 기본은 batch 모드 (0.25초 실시간 페이싱 없이 전송)
+    norealtime: bool = True
+    # [advice from AI] batch 모드에서 서버 응답 없이 먼저 보낼 수 있는 최대 바이트 (초과 시 서버 응답 대기)
+    max_in_flight_bytes: int = 256 * 1024
+
+
+# [advice from AI] 서버 응답(진행률/결과)을 기다리는 최대 시간 - 응답이 없어도 전송이 멈추지 않도록
+CREDIT_WAIT_SEC = 1.0
 
 
 @dataclass 
@@ -41,7 +50,9 @@ class HAIVSTTClient:
         self.config = config or HAIVConfig()
         self.websocket = None
         self.is_connected = False
-        self.results = []
+        self._queue: Optional[asyncio.Queue] = None
+        self._in_flight = 0
+        self._credit = asyncio.Event()
         
     def _build_uri(self) -> str:
         """WebSocket URI 생성 - HAIV 스펙"""
@@ -104,31 +115,83 @@ class HAIVSTTClient:
             print(f"[HAIV] 파일 없음: {audio_path}")
             return
         
+        async for result in self._transcribe(self._send_audio(audio_path), start_offset):
+            yield result
+    
+    async def transcribe_stream(
+        self,
+        input_path: str,
+        start_offset: float = 0.0
+    ) -> AsyncGenerator[STTResult, None]:
+        """미디어 파일을 WAV 파일 없이 STT로 변환
+        
+        [advice from AI] ffmpeg가 디코딩한 raw PCM을 stdout 파이프에서 바로 전송 (디스크 쓰기/읽기, WAV 헤더 처리 생략)
+        """
+        if not os.path.exists(input_path):
+            print(f"[HAIV] 파일 없음: {input_path}")
+            return
+        
+        async for result in self._transcribe(self._send_pcm_stream(input_path), start_offset):
+            yield result
+    
+    async def _transcribe(self, send_coro, start_offset: float) -> AsyncGenerator[STTResult, None]:
+        """송신 코루틴과 결과 수신을 병렬 실행"""
         if not self.is_connected:
             if not await self.connect():
+                send_coro.close()
                 return
         
-        self.results = []
+        # [advice from AI] 고정 30초 대기 후 일괄 반환 대신, 수신되는 즉시 큐로 전달하고 EOS/연결 종료 시 끝냄
+        self._queue = asyncio.Queue()
+        self._in_flight = 0
+        
+        # [advice from AI] 송신/수신 태스크 병렬 실행
+        send_task = asyncio.create_task(send_coro)
+        receive_task = asyncio.create_task(self._receive_results(start_offset))
         
         try:
-            # [advice from AI] 송신/수신 태스크 병렬 실행
-            send_task = asyncio.create_task(self._send_audio(audio_path))
-            receive_task = asyncio.create_task(self._receive_results(start_offset))
+            while True:
+                result = await self._queue.get()
+                if result is None:
+                    break
+                yield result
             
             await send_task
-            
-            try:
-                await asyncio.wait_for(receive_task, timeout=30.0)
-            except asyncio.TimeoutError:
-                print("[HAIV] 수신 타임아웃")
-            
-            for result in self.results:
-                yield result
                 
         except Exception as e:
             print(f"[HAIV] STT 오류: {e}")
             import traceback
             traceback.print_exc()
+        finally:
+            # 소비 측이 먼저 끝나도 송신/수신 태스크는 남기지 않음
+            send_task.cancel()
+            receive_task.cancel()
+    
+    async def _pace(self, sent: int):
+        """전송 속도 조절
+        
+        실시간 모드는 HAIV 스펙대로 0.25초 간격, batch 모드는 고정 sleep 대신
+        전송했지만 서버 응답이 없는 바이트가 max_in_flight_bytes를 넘을 때만 응답을 대기
+        """
+        if not self.config.norealtime:
+            await asyncio.sleep(0.25)
+            return
+        
+        self._in_flight += sent
+        if self._in_flight < self.config.max_in_flight_bytes:
+            return
+        
+        self._credit.clear()
+        try:
+            await asyncio.wait_for(self._credit.wait(), timeout=CREDIT_WAIT_SEC)
+        except asyncio.TimeoutError:
+            pass
+        self._in_flight = 0
+    
+    def _grant_credit(self):
+        """서버 응답 수신 - 대기 중인 전송 재개"""
+        self._in_flight = 0
+        self._credit.set()
     
     async def _send_audio(self, audio_path: str):
         """오디오 데이터 전송 - HAIV 스펙"""
@@ -146,21 +209,72 @@ class HAIVSTTClient:
                         break
                     
                     await self.websocket.send(chunk)
-                    
-                    if not self.config.norealtime:
-                        await asyncio.sleep(0.25)
+                    await self._pace(len(chunk))
             
-            # [advice from AI] 전송 완료: "EOS" 문자열
-            await self.websocket.send("EOS")
-            print("[HAIV] EOS 전송")
+        except Exception as e:
+            print(f"[HAIV] 전송 오류: {e}")
+        
+        await self._send_eos()
+    
+    async def _send_pcm_stream(self, input_path: str):
+        """ffmpeg raw PCM 출력을 그대로 전송 - HAIV 스펙"""
+        chunk_size = self.config.byterate // 4  # 4000 bytes
+        # [advice from AI] byterate는 16비트 모노 기준 → 샘플레이트 = byterate / 2
+        process = await asyncio.create_subprocess_exec(
+            audio_extractor.ffmpeg_path, "-v", "error",
+            "-i", input_path,
+            "-vn",
+            "-f", "s16le",
+            "-acodec", "pcm_s16le",
+            "-ar", str(self.config.byterate // 2),
+            "-ac", "1",
+            "-",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            limit=1 << 20
+        )
+        try:
+            while True:
+                try:
+                    chunk = await process.stdout.readexactly(chunk_size)
+                except asyncio.IncompleteReadError as e:
+                    # 마지막 조각 (chunk_size 미만)
+                    if e.partial:
+                        await self.websocket.send(e.partial)
+                    break
+                
+                await self.websocket.send(chunk)
+                await self._pace(len(chunk))
             
         except Exception as e:
             print(f"[HAIV] 전송 오류: {e}")
+        finally:
+            if process.returncode is None:
+                process.kill()
+            await process.wait()
+        
+        await self._send_eos()
+    
+    async def _send_eos(self):
+        """전송 완료: "EOS" 문자열
+        
+        [advice from AI] 전송이 중간에 실패해도 호출 → 서버 EOS 응답으로 수신 측이 끝남
+        EOS 전송마저 실패하면 결과 대기가 끝나도록 큐에 종료 표시
+        """
+        try:
+            await self.websocket.send("EOS")
+            print("[HAIV] EOS 전송")
+        except Exception as e:
+            print(f"[HAIV] EOS 전송 오류: {e}")
+            self._queue.put_nowait(None)
     
     async def _receive_results(self, start_offset: float):
         """결과 수신 - HAIV 스펙"""
         try:
             async for message in self.websocket:
+                # [advice from AI] 서버가 응답할 때마다 전송 한도 회복
+                self._grant_credit()
+                
                 # Progress 메시지
                 if isinstance(message, str) and message.startswith("Progress:"):
                     progress = message.split(":", 1)[1].strip()
@@ -171,17 +285,18 @@ class HAIVSTTClient:
                 
                 # JSON 결과
                 try:
-                    response = json.loads(message)
-                except json.JSONDecodeError as e:
+                    response = orjson.loads(message)
+                except orjson.JSONDecodeError as e:
                     print(f"[HAIV] JSON 오류: {e}")
                     continue
                 
-                print(f"[HAIV] 응답: {json.dumps(response, ensure_ascii=False)[:200]}")
+                # [advice from AI] 받은 원문을 그대로 출력 (파싱한 dict를 다시 직렬화하지 않음, bytes는 디코딩 후 출력)
+                text = message.decode(errors="replace") if isinstance(message, bytes) else message
+                print(f"[HAIV] 응답: {text[:200]}")
                 
                 # [advice from AI] HAIV 응답 파싱
-                if 'status' in response and 'result' in response:
-                    result = response.get('result', {})
-                    
+                result = response.get('result') if 'status' in response else None
+                if result:
                     if result.get('final'):
                         hypotheses = result.get('hypotheses', [])
                         if hypotheses:
@@ -195,7 +310,7 @@ class HAIVSTTClient:
                                 
                                 speaker_str = f"화자{speaker}" if speaker is not None else None
                                 
-                                self.results.append(STTResult(
+                                self._queue.put_nowait(STTResult(
                                     text=transcript,
                                     start_time=start_offset + seg_start,
                                     end_time=start_offset + seg_end,
@@ -214,6 +329,9 @@ class HAIVSTTClient:
             print(f"[HAIV] 연결 종료: {e}")
         except Exception as e:
             print(f"[HAIV] 수신 오류: {e}")
+        finally:
+            # 결과 끝 표시 (EOS 수신/연결 종료/오류)
+            self._queue.put_nowait(None)
 
 
 def get_haiv_client() -> HAIVSTTClient:
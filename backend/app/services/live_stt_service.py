@@ -3,7 +3,7 @@
 
 import os
 import asyncio
-import json
+import orjson
 from typing import Optional, Callable, Awaitable
 from dataclasses import dataclass
 import websockets
@@ -12,6 +12,11 @@ from fastapi import WebSocket
 from .realtime_stt import RealtimeSubtitle
 
 
+async def send_json(websocket: WebSocket, payload: dict):
+    """클라이언트 WebSocket JSON 전송 (orjson 직렬화, 텍스트 프레임 유지)"""
+    await websocket.send_text(orjson.dumps(payload).decode())
+
+
 @dataclass
 class LiveSTTConfig:
     """라이브 STT 설정"""
@@ -82,7 +87,7 @@ class LiveSTTService:
                 print(f"[LIVE-STT] ✅ STT 서버 연결 성공!")
                 
                 # 클라이언트에 연결 성공 알림
-                await client_ws.send_json({
+                await send_json(client_ws, {
                     "type": "connected",
                     "data": {"engine": self.config.stt_engine}
                 })
@@ -103,7 +108,7 @@ class LiveSTTService:
                                 if msg_count <= 5 or msg_count % 10 == 0:
                                     print(f"[LIVE-STT] 📩 메시지 #{msg_count}: {str(message)[:200]}")
                                 
-                                response = json.loads(message)
+                                response = orjson.loads(message)
                                 subtitle = self._parse_stt_response(response)
                                 
                                 if subtitle:
@@ -112,7 +117,7 @@ class LiveSTTService:
                                         await on_subtitle(subtitle)
                                     
                                     # 클라이언트에 자막 전송
-                                    await client_ws.send_json({
+                                    await send_json(client_ws, {
                                         "type": "subtitle",
                                         "data": {
                                             "id": subtitle.id,
@@ -128,7 +133,7 @@ class LiveSTTService:
                                     print(f"[LIVE-STT] 📥 STT 완료")
                                     break
                                     
-                            except json.JSONDecodeError as e:
+                            except orjson.JSONDecodeError as e:
                                 print(f"[LIVE-STT] ⚠️ JSON 파싱 오류: {e}, 메시지: {str(message)[:100]}")
                     except Exception as e:
                         print(f"[LIVE-STT] ❌ STT 수신 오류: {e}")
@@ -141,6 +146,9 @@ class LiveSTTService:
                     chunk_count = 0
                     audio_buffer = bytearray()  # 오디오 버퍼 (청크 크기 맞추기용)
                     HAIV_CHUNK_SIZE = 4000  # HAIV 예상 청크 크기 (byterate/4)
+                    # [advice from AI] 엔진 분기는 연결당 한 번만 판정
+                    is_haiv = self.config.stt_engine == "haiv"
+                    streaming_logged = False
                     
                     try:
                         while self.is_running:
@@ -156,26 +164,37 @@ class LiveSTTService:
                                     audio_chunk = data["bytes"]
                                     
                                     # [advice from AI] HAIV: 청크 크기를 맞춰서 전송
-                                    if self.config.stt_engine == "haiv":
+                                    if is_haiv:
                                         audio_buffer.extend(audio_chunk)
                                         
                                         # 버퍼가 충분히 쌓이면 전송
-                                        while len(audio_buffer) >= HAIV_CHUNK_SIZE:
-                                            chunk_to_send = bytes(audio_buffer[:HAIV_CHUNK_SIZE])
-                                            audio_buffer = audio_buffer[HAIV_CHUNK_SIZE:]
-                                            await stt_ws.send(chunk_to_send)
-                                            chunk_count += 1
+                                        # [advice from AI] 남은 버퍼 전체를 매번 복사하지 않도록 오프셋으로 잘라 보내고,
+                                        # 보낸 앞부분은 마지막에 한 번만 제거 (bytearray 앞쪽 삭제는 재할당 없음)
+                                        # 전송 도중 실패해도 이미 보낸 부분은 지워서 종료 시 남은 버퍼 전송에서 중복되지 않도록 함
+                                        sent = 0
+                                        try:
+                                            while len(audio_buffer) - sent >= HAIV_CHUNK_SIZE:
+                                                with memoryview(audio_buffer) as view:
+                                                    chunk_to_send = bytes(view[sent:sent + HAIV_CHUNK_SIZE])
+                                                await stt_ws.send(chunk_to_send)
+                                                sent += HAIV_CHUNK_SIZE
+                                                chunk_count += 1
+                                        finally:
+                                            if sent:
+                                                del audio_buffer[:sent]
                                     else:
                                         # Whisper: 그대로 전송
                                         await stt_ws.send(audio_chunk)
                                         chunk_count += 1
                                     
-                                    if chunk_count % 16 == 0:  # 로그
-                                        print(f"[LIVE-STT] 📤 {chunk_count}개 청크 전송")
+                                    # [advice from AI] 청크마다 로그 대신 전송 시작 시 한 번만 (총 개수는 종료 시 출력)
+                                    if not streaming_logged and chunk_count:
+                                        streaming_logged = True
+                                        print(f"[LIVE-STT] 📤 오디오 전송 시작")
                                         
                                 elif "text" in data:
                                     # 텍스트 메시지 (제어 명령)
-                                    msg = json.loads(data["text"])
+                                    msg = orjson.loads(data["text"])
                                     
                                     if msg.get("type") == "stop":
                                         print(f"[LIVE-STT] 🛑 클라이언트 중지 요청")
@@ -190,7 +209,7 @@ class LiveSTTService:
                         print(f"[LIVE-STT] ❌ 오디오 전송 오류: {e}")
                     finally:
                         # [advice from AI] 남은 버퍼 전송 (HAIV)
-                        if self.config.stt_engine == "haiv" and len(audio_buffer) > 0:
+                        if is_haiv and len(audio_buffer) > 0:
                             try:
                                 await stt_ws.send(bytes(audio_buffer))
                                 chunk_count += 1
@@ -214,7 +233,7 @@ class LiveSTTService:
                 
         except websockets.exceptions.WebSocketException as e:
             print(f"[LIVE-STT] ❌ STT 연결 오류: {e}")
-            await client_ws.send_json({
+            await send_json(client_ws, {
                 "type": "error",
                 "data": {"message": f"STT 서버 연결 실패: {str(e)}"}
             })
@@ -87,7 +87,7 @@ class STTPipeline:
             ))
             
             # 영상 길이 확인
-            total_duration = audio_extractor.get_duration(input_path)
+            total_duration = await audio_extractor.get_duration(input_path)
             if total_duration <= 0:
                 return PipelineResult(
                     success=False,
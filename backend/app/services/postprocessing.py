@@ -819,35 +819,30 @@ def _load_json_profanity():
     data = _load_json_data()
     return data.get('profanity', [])
 
-def _load_json_abbreviations():
-    """JSON 파일에서 약어 사전 로드 (key-value 형태)"""
-    data = _load_json_data()
-    items = data.get('abbreviations', [])
+def _kv_items_to_dict(items):
+    """key-value 사전 변환 ({key: value} 형식 및 구버전 [{key, value}] 리스트 형식 모두 지원)"""
+    if isinstance(items, dict):
+        return items
     result = {}
     for item in items:
         if isinstance(item, dict) and 'key' in item and 'value' in item:
             result[item['key']] = item['value']
     return result
 
+def _load_json_abbreviations():
+    """JSON 파일에서 약어 사전 로드 (key-value 형태)"""
+    data = _load_json_data()
+    return _kv_items_to_dict(data.get('abbreviations', {}))
+
 def _load_json_proper_nouns():
     """JSON 파일에서 고유명사 사전 로드"""
     data = _load_json_data()
-    items = data.get('proper_nouns', [])
-    result = {}
-    for item in items:
-        if isinstance(item, dict) and 'key' in item and 'value' in item:
-            result[item['key']] = item['value']
-    return result
+    return _kv_items_to_dict(data.get('proper_nouns', {}))
 
 def _load_json_government_dict():
     """JSON 파일에서 정부 용어 사전 로드"""
     data = _load_json_data()
-    items = data.get('government_dict', [])
-    result = {}
-    for item in items:
-        if isinstance(item, dict) and 'key' in item and 'value' in item:
-            result[item['key']] = item['value']
-    return result
+    return _kv_items_to_dict(data.get('government_dict', {}))
 
 def _get_compiled_patterns():
     """런타임에 추가된 패턴도 포함하여 컴파일 (JSON 파일 패턴 포함)"""
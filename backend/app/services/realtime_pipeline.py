@@ -7,7 +7,7 @@ import shutil
 from typing import Optional, AsyncGenerator, Callable
 from dataclasses import dataclass, asdict
 from enum import Enum
-import json
+import orjson
 
 from .audio_extractor import audio_extractor
 from .stt_service import stt_service
@@ -34,15 +34,19 @@ class StreamEvent:
     type: StreamEventType
     data: dict
     
-    def to_json(self) -> str:
-        return json.dumps({
+    def _dumps(self) -> bytes:
+        # [advice from AI] orjson은 UTF-8 바이트를 바로 생성 (ensure_ascii=False와 동일)
+        return orjson.dumps({
             "type": self.type.value,
             "data": self.data
-        }, ensure_ascii=False)
+        })
+    
+    def to_json(self) -> str:
+        return self._dumps().decode()
     
-    def to_sse(self) -> str:
+    def to_sse(self) -> bytes:
         """Server-Sent Events 형식으로 변환"""
-        return f"data: {self.to_json()}\n\n"
+        return b"data: " + self._dumps() + b"\n\n"
 
 
 class RealtimeSTTPipeline:
@@ -85,7 +89,7 @@ class RealtimeSTTPipeline:
             self.temp_dir = tempfile.mkdtemp(prefix="ktv_realtime_")
             
             # 영상 길이 확인
-            total_duration = audio_extractor.get_duration(input_path)
+            total_duration = await audio_extractor.get_duration(input_path)
             if total_duration <= 0:
                 yield StreamEvent(
                     type=StreamEventType.ERROR,
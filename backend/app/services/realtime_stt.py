@@ -4,9 +4,15 @@
 import os
 import asyncio
 import subprocess
-from typing import AsyncGenerator, Optional, Dict, Any
+from bisect import bisect_right
+from typing import AsyncGenerator, Optional, Dict, Any, List
 from dataclasses import dataclass
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 @dataclass
 class RealtimeSubtitle:
@@ -51,6 +57,60 @@ HAIV_PRESETS: Dict[str, Dict[str, Any]] = {
 }
 
 
+# [advice from AI] 무음 게이트 - 긴 무음 구간은 STT 서버로 보내지 않아 불필요한 디코딩 생략
+SILENCE_RMS_THRESHOLD = float(os.getenv("SILENCE_RMS_THRESHOLD", "0.01"))  # int16 정규화 RMS
+SILENCE_KEEP_SEC = 1.0  # 문장 끝 검출(endpoint)용으로 남겨 두는 무음 길이
+
+
+def pcm_rms(chunk: bytes) -> float:
+    """PCM int16 청크의 정규화 RMS (numpy 미설치 시 1.0 → 게이트 비활성)"""
+    if np is None:
+        return 1.0
+    samples = np.frombuffer(chunk, dtype=np.int16, count=len(chunk) // 2).astype(np.float32)
+    if samples.size == 0:
+        return 0.0
+    samples *= 1.0 / 32768.0
+    return float(np.sqrt(np.mean(samples * samples)))
+
+
+class SilenceGate:
+    """무음 청크 건너뛰기 + 건너뛴 시간만큼 STT 타임스탬프 보정"""
+    
+    def __init__(self, bytes_per_sec: int):
+        self.bytes_per_sec = bytes_per_sec
+        self.sent_bytes = 0
+        self.silent_bytes = 0  # 연속 무음 길이
+        self.skipped_sec = 0.0
+        self._skip_at: List[float] = []     # 건너뛰기가 일어난 전송 기준 시각
+        self._skip_total: List[float] = []  # 해당 시점까지 누적 건너뛴 시간
+    
+    def should_send(self, chunk: bytes, force: bool = False) -> bool:
+        """청크 전송 여부 (연속 무음이 SILENCE_KEEP_SEC를 넘으면 False)
+        
+        force=True면 무음 검사 없이 항상 전송하되 전송량에는 포함 (타임스탬프 보정 기준 유지)
+        """
+        if force or pcm_rms(chunk) >= SILENCE_RMS_THRESHOLD:
+            self.silent_bytes = 0
+        else:
+            self.silent_bytes += len(chunk)
+            if self.silent_bytes > SILENCE_KEEP_SEC * self.bytes_per_sec:
+                self.skipped_sec += len(chunk) / self.bytes_per_sec
+                sent_sec = self.sent_bytes / self.bytes_per_sec
+                if self._skip_at and self._skip_at[-1] == sent_sec:
+                    self._skip_total[-1] = self.skipped_sec
+                else:
+                    self._skip_at.append(sent_sec)
+                    self._skip_total.append(self.skipped_sec)
+                return False
+        self.sent_bytes += len(chunk)
+        return True
+    
+    def to_source_time(self, sent_sec: float) -> float:
+        """STT 서버 기준 시각 → 원본 오디오 기준 시각"""
+        idx = bisect_right(self._skip_at, sent_sec)
+        return sent_sec + (self._skip_total[idx - 1] if idx else 0.0)
+
+
 class HAIVStreamingSTT:
     """
     HAIV 실시간 스트리밍 STT
@@ -146,6 +206,10 @@ class HAIVStreamingSTT:
                 
                 results_queue = asyncio.Queue()
                 send_done = asyncio.Event()
+                # mono int16 PCM 기준 (HAIV segment 시각은 전송한 오디오 기준)
+                # [advice from AI] 샘플레이트는 아래 FFmpeg -ar과 같은 값 사용
+                sample_rate = self.config['sample_rate']
+                silence_gate = SilenceGate(bytes_per_sec=sample_rate * 2)
                 
                 async def stream_audio_to_haiv():
                     """FFmpeg로 실시간 오디오 추출 → HAIV 전송"""
@@ -161,7 +225,7 @@ class HAIVStreamingSTT:
                         '-i', input_path,
                         '-vn',                    # 비디오 제외
                         '-acodec', 'pcm_s16le',   # 16bit PCM
-                        '-ar', '16000',           # 16kHz (원본 HAIV 클라이언트와 동일)
+                        '-ar', str(sample_rate),  # 16kHz (원본 HAIV 클라이언트와 동일)
                         '-ac', '1',               # 모노
                         '-f', 'wav',              # WAV 형식 (헤더 포함!)
                         '-loglevel', 'error',
@@ -198,7 +262,9 @@ class HAIVStreamingSTT:
                             if not chunk:
                                 break
                             
-                            await ws.send(chunk)
+                            # 첫 청크는 WAV 헤더 포함 - 항상 전송 (게이트 전송량에는 포함)
+                            if silence_gate.should_send(chunk, force=chunk_count == 0):
+                                await ws.send(chunk)
                             total_bytes += len(chunk)
                             chunk_count += 1
                             
@@ -216,7 +282,7 @@ class HAIVStreamingSTT:
                         # 마지막 EOS 전송 (모든 오디오 전송 완료 후 1번만!)
                         await ws.send("EOS")
                         seconds = total_bytes / self.config['byterate']
-                        print(f"[HAIV-STT] 📤 EOS 전송 (총 {seconds:.1f}초 오디오)")
+                        print(f"[HAIV-STT] 📤 EOS 전송 (총 {seconds:.1f}초 오디오, 무음 {silence_gate.skipped_sec:.1f}초 생략)")
                         
                     except Exception as e:
                         print(f"[HAIV-STT] ❌ 전송 오류: {e}")
@@ -273,8 +339,9 @@ class HAIVStreamingSTT:
                                             print(f"[HAIV-STT] ⏱️ 처리속도: 실시간 {elapsed:.1f}s → 오디오 {audio_time:.1f}s ({throughput:.1f}x)")
                                             
                                             # [advice from AI] 타임스탬프는 HAIV가 반환한 값 그대로 사용
-                                            actual_start = start_offset + seg_start
-                                            actual_end = start_offset + seg_start + seg_length
+                                            # (무음 게이트로 건너뛴 시간은 원본 기준으로 되돌림)
+                                            actual_start = start_offset + silence_gate.to_source_time(seg_start)
+                                            actual_end = start_offset + silence_gate.to_source_time(seg_start + seg_length)
                                             
                                             # [advice from AI] HAIV 모델은 화자 분리 없음 - speaker는 항상 None
                                             self.segment_id += 1
@@ -0,0 +1,58 @@
+# [advice from AI] 동시 스트림 수 제한 (실시간 STT SSE / 비디오 프록시)
+# 클라이언트 수만큼 yt-dlp·STT·업스트림 연결이 늘어나지 않도록 상한을 두고, 초과 요청은 빈 자리가 날 때까지 대기
+# 상한은 관리자 API로 재시작 없이 변경 가능 (대기 중인 요청은 변경 즉시 조건을 다시 확인)
+
+import os
+import asyncio
+from contextlib import asynccontextmanager
+
+# [advice from AI] 기본 상한 (0이면 제한 없음)
+MAX_LIVE_STREAMS = int(os.getenv("MAX_LIVE_STREAMS", "8"))
+MAX_PROXY_STREAMS = int(os.getenv("MAX_PROXY_STREAMS", "32"))
+
+
+class StreamLimiter:
+    """asyncio.Condition 기반 동시 실행 수 제한"""
+
+    def __init__(self, name: str, limit: int):
+        self.name = name
+        self.limit = limit
+        self.active = 0
+        self._cond = asyncio.Condition()
+
+    def _has_slot(self) -> bool:
+        return self.limit <= 0 or self.active < self.limit
+
+    async def acquire(self):
+        """빈 자리가 날 때까지 대기 후 점유"""
+        async with self._cond:
+            await self._cond.wait_for(self._has_slot)
+            self.active += 1
+
+    async def release(self):
+        """점유 해제 후 대기 중인 요청 하나 깨움"""
+        async with self._cond:
+            self.active -= 1
+            self._cond.notify(1)
+
+    @asynccontextmanager
+    async def slot(self):
+        await self.acquire()
+        try:
+            yield
+        finally:
+            await self.release()
+
+    async def set_limit(self, limit: int):
+        """상한 변경 (늘어난 만큼 대기 요청이 바로 진행)"""
+        async with self._cond:
+            self.limit = limit
+            self._cond.notify_all()
+
+    def stats(self) -> dict:
+        return {"limit": self.limit, "active": self.active}
+
+
+# 싱글톤 인스턴스
+live_stream_limiter = StreamLimiter("live", MAX_LIVE_STREAMS)
+proxy_stream_limiter = StreamLimiter("proxy", MAX_PROXY_STREAMS)
@@ -7,25 +7,27 @@ from ..models.subtitle import SubtitleSegment
 class SubtitleService:
     """자막 파일 생성 서비스"""
     
+    @staticmethod
+    def _format_time(seconds: float, sep: str) -> str:
+        """시간을 HH:MM:SS{sep}mmm 형식으로 변환
+        
+        [advice from AI] 정수 초에서 divmod로 시/분/초를 나눠 부동소수 나눗셈/나머지 반복 제거
+        밀리초는 기존 출력과 같도록 소수부를 그대로 잘라서 사용 (반올림하지 않음)
+        """
+        millis = int((seconds % 1) * 1000)
+        minutes, secs = divmod(int(seconds), 60)
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours:02d}:{minutes:02d}:{secs:02d}{sep}{millis:03d}"
+    
     @staticmethod
     def format_srt_time(seconds: float) -> str:
         """시간을 SRT 형식으로 변환 (HH:MM:SS,mmm)"""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millis = int((seconds % 1) * 1000)
-        
-        return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+        return SubtitleService._format_time(seconds, ",")
     
     @staticmethod
     def format_vtt_time(seconds: float) -> str:
         """시간을 VTT 형식으로 변환 (HH:MM:SS.mmm)"""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millis = int((seconds % 1) * 1000)
-        
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
+        return SubtitleService._format_time(seconds, ".")
     
     def generate_srt(
         self,
@@ -0,0 +1,55 @@
+# [advice from AI] 업로드 임시 파일 저장 - 라우터 공통
+# STT 후 바로 삭제되는 업로드는 tmpfs(/dev/shm)에 저장 (디스크 쓰기/읽기 생략)
+# tmpfs는 RAM 용량 제한이 있으므로 크기 상한 + 여유 공간 확인 후 넘치면 UPLOAD_DIR 사용
+
+import os
+import shutil
+import asyncio
+import secrets
+
+from fastapi import UploadFile
+
+# [advice from AI] 업로드 디렉토리 (디스크)
+UPLOAD_DIR = os.getenv("UPLOAD_DIR", "/tmp/ktv-uploads")
+os.makedirs(UPLOAD_DIR, exist_ok=True)
+
+# [advice from AI] tmpfs 업로드 디렉토리 (없거나 생성 실패 시 비활성화)
+SHM_UPLOAD_DIR = os.getenv("SHM_UPLOAD_DIR", "/dev/shm/ktv-uploads" if os.path.isdir("/dev/shm") else "")
+SHM_UPLOAD_MAX_BYTES = int(os.getenv("SHM_UPLOAD_MAX_BYTES", str(256 << 20)))
+SHM_RESERVE_BYTES = 64 << 20
+if SHM_UPLOAD_DIR:
+    try:
+        os.makedirs(SHM_UPLOAD_DIR, exist_ok=True)
+    except OSError:
+        SHM_UPLOAD_DIR = ""
+
+# [advice from AI] 업로드 파일을 메모리에 통째로 올리지 않고 1MiB 단위로 기록
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+
+def upload_path(prefix: str, file: UploadFile, file_ext: str) -> str:
+    """업로드 임시 파일 경로 (크기가 작으면 tmpfs, 아니면 디스크)"""
+    name = f"{prefix}_{secrets.token_hex(8)}{file_ext}"
+    size = file.size
+    if SHM_UPLOAD_DIR and size is not None and size <= SHM_UPLOAD_MAX_BYTES:
+        try:
+            if shutil.disk_usage(SHM_UPLOAD_DIR).free - size > SHM_RESERVE_BYTES:
+                return os.path.join(SHM_UPLOAD_DIR, name)
+        except OSError:
+            pass
+    return os.path.join(UPLOAD_DIR, name)
+
+
+def _copy_upload(src, path: str) -> int:
+    """업로드 파일 객체를 복사하고 바이트 수 반환"""
+    with open(path, "wb") as dst:
+        shutil.copyfileobj(src, dst, UPLOAD_CHUNK_SIZE)
+        return dst.tell()
+
+
+async def save_upload(file: UploadFile, path: str) -> int:
+    """업로드 파일을 저장하고 저장한 바이트 수 반환
+
+    [advice from AI] 청크마다 스레드 왕복 대신 워커 스레드 한 번에서 copyfileobj로 복사
+    """
+    return await asyncio.to_thread(_copy_upload, file.file, path)
@@ -10,7 +10,7 @@ const API_URL = import.meta.env.VITE_API_URL ||
 
 // [advice from AI] 스트림 이벤트 타입
 export interface StreamEvent {
-  type: 'init' | 'subtitle' | 'progress' | 'complete' | 'error';
+  type: 'init' | 'subtitle' | 'subtitle_batch' | 'progress' | 'complete' | 'error';
   data: any;
 }
 
@@ -162,6 +162,13 @@ function handleUltraEvent(event: StreamEvent, callbacks: UltraRealtimeCallbacks)
       callbacks.onSubtitle?.(segment, event.data.latency_ms);
       break;
       
+    // [advice from AI] 짧은 시간 창에 몰린 자막 묶음 (data: 자막 배열)
+    case 'subtitle_batch':
+      for (const item of event.data) {
+        handleUltraEvent({ type: 'subtitle', data: item }, callbacks);
+      }
+      break;
+      
     case 'progress':
       callbacks.onProgress?.(event.data.progress, event.data.count);
       break;